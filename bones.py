@@ -0,0 +1,160 @@
+import asyncio, bisect, logging, math
+from collections import defaultdict
+
+from storage import apply_bone_op
+
+logger = logging.getLogger()
+
+
+def log_message(message):
+    logger.info(f"[System] Bones {message}")
+
+
+# ✅ One guild's bones kept in both display orders; each op moves one entry instead of re-sorting the list
+class Leaderboard:
+    def __init__(self, names=None):
+        self.counts = {}
+        self.by_count = []  # ✅ (-count, name.lower(), name), highest first
+        self.by_name = []  # ✅ (name.lower(), name), A-Z
+        self.total = 0
+        self.version = 0  # ✅ Bumped on every change
+        for name, entry in (names or {}).items():
+            self.counts[name] = entry.get("count", 0)
+            self.total += self.counts[name]
+        self.by_count = sorted((-count, name.lower(), name) for name, count in self.counts.items())
+        self.by_name = sorted((name.lower(), name) for name in self.counts)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def apply(self, op):
+        name = op["name"]
+        previous = self.counts.get(name)
+        if previous is not None:
+            del self.by_count[bisect.bisect_left(self.by_count, (-previous, name.lower(), name))]
+            self.total -= previous
+
+        if op["op"] == "remove":
+            if previous is not None:
+                del self.counts[name]
+                del self.by_name[bisect.bisect_left(self.by_name, (name.lower(), name))]
+        else:
+            self.counts[name] = op["count"]
+            self.total += op["count"]
+            bisect.insort(self.by_count, (-op["count"], name.lower(), name))
+            if previous is None:
+                bisect.insort(self.by_name, (name.lower(), name))
+        self.version += 1
+
+    def page_count(self, per_page=10):
+        return max(math.ceil(len(self.counts) / per_page), 1)
+
+    def names_page(self, page, per_page=25):
+        start = page * per_page
+        return [name for _, name in self.by_name[start:start + per_page]]
+
+    # ✅ Case-insensitive prefix lookup: one bisect into `by_name`, then at most `limit` entries read
+    def search(self, prefix, limit=25):
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self.by_name, (prefix,))
+        matches = []
+        for lowered, name in self.by_name[start:start + limit]:
+            if not lowered.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
+
+    def page(self, mode, page, per_page=10):
+        start = page * per_page
+        if mode == "alpha":
+            return [{"name": name, "count": self.counts[name]} for _, name in self.by_name[start:start + per_page]]
+        return [{"name": name, "count": -negative_count} for negative_count, _, name in self.by_count[start:start + per_page]]
+
+
+# ✅ In-memory bones store; the storage backend only sees one small op per change
+class BonesStore:
+    def __init__(self, storage, run_io):
+        self.storage = storage
+        self.run_io = run_io  # ✅ Runs storage calls off the event loop, in submission order
+        self.locks = defaultdict(asyncio.Lock)  # ✅ One per guild: read-modify-writes of that guild's names queue up
+        self.dirty_guilds = set()  # ✅ Guilds changed since the last compaction
+        self.writes_requested = 0  # ✅ Saves requested by handlers
+        self.writes_performed = 0  # ✅ Writes the backend actually did: snapshot rewrites (JSON) or row upserts (SQLite)
+        self.data = storage.load_bones()  # ✅ Serve every read from memory
+        self.leaderboards = {guild_id: Leaderboard(names) for guild_id, names in self.data.items()}
+
+    def set(self, guild_id, key, value):
+        previous = self.data.get(guild_id, {}).get(key)
+
+        # ✅ Every op carries the resulting count, so replaying an op twice is harmless
+        if value is None:
+            op = {"op": "remove", "guild": guild_id, "name": key}
+        elif previous is None:
+            op = {"op": "add", "guild": guild_id, "name": key, "count": value["count"]}
+        elif value["count"] == previous.get("count", 0) + 1:
+            op = {"op": "incr", "guild": guild_id, "name": key, "count": value["count"]}
+        else:
+            op = {"op": "set", "guild": guild_id, "name": key, "count": value["count"]}
+
+        apply_bone_op(self.data, op)  # ✅ Memory is updated right away; the caller persists `op`
+        self.leaderboards.setdefault(guild_id, Leaderboard()).apply(op)  # ✅ Kept even when empty so open views stay attached
+
+        self.dirty_guilds.add(guild_id)  # ✅ Folded into the snapshot on the next compaction
+        self.writes_requested += 1
+        if not self.storage.snapshot_writes:
+            self.writes_performed += 1  # ✅ The caller persists `op` as one row write
+        return op
+
+    # ✅ Memory first, then one journal append/row upsert on the I/O thread
+    async def save(self, guild_id, key, value):
+        op = self.set(guild_id, key, value)
+        await self.run_io(self.storage.record_bone_op, op)
+
+    def lock(self, guild_id):
+        return self.locks[str(guild_id)]
+
+    def leaderboard(self, guild_id):
+        return self.leaderboards.get(str(guild_id))
+
+    @property
+    def writes_saved(self):
+        if not self.storage.snapshot_writes:
+            return None  # ✅ Nothing is batched, so there are no saved writes to report
+        return max(self.writes_requested - self.writes_performed, 0)
+
+    def snapshot(self):
+        return {guild_id: {name: dict(entry) for name, entry in names.items()} for guild_id, names in self.data.items()}
+
+    async def compact(self):
+        if not self.dirty_guilds:
+            return False  # ✅ Snapshot is already up to date
+
+        # ✅ Copy on the loop, write on the I/O thread; ops submitted after this line queue behind the compaction
+        compacted_guilds = sorted(self.dirty_guilds)
+        self.dirty_guilds.clear()
+        if not await self.run_io(self.storage.compact_bones, self.snapshot()):
+            self.dirty_guilds.update(compacted_guilds)
+            return False
+
+        if self.storage.snapshot_writes:
+            self.writes_performed += 1
+            log_message(f"💾 Compacted bones for guilds {compacted_guilds} (disk rewrites saved so far: {self.writes_saved})")
+        else:
+            log_message(f"💾 Compacted bones for guilds {compacted_guilds}")
+        return True
+
+    def compact_at_exit(self):
+        if self.dirty_guilds and self.storage.compact_bones(self.data):
+            self.dirty_guilds.clear()
+
+
+
+# ✅ Read-modify-write of one name under the guild's bones lock; `change(count or None)` returns the new count (None removes)
+async def update_bone(store, guild_id, name, change):
+    async with store.lock(guild_id):
+        current = store.data.get(str(guild_id), {}).get(name)
+        current_count = current["count"] if current else None
+        new_count = change(current_count)
+        if new_count != current_count:
+            await store.save(str(guild_id), name, {"count": new_count} if new_count is not None else None)
+        return current_count, new_count
@@ -1,51 +1,320 @@
-import functools, json, datetime, inspect, logging, re, os, pytz, asyncio, sys, random, uuid, dateparser, parsedatetime, discord
+import time
+STARTUP_STARTED = time.perf_counter()  # ✅ Reference point for the startup-time breakdown
+
+import atexit, bisect, contextvars, functools, gzip, hashlib, json, datetime, logging, logging.handlers, math, queue, re, os, pytz, asyncio, shutil, sys, random, threading, uuid, discord
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
-from dateutil import parser
 from dotenv import load_dotenv
 from discord.ext import commands, tasks
 from discord import app_commands
+from aiohttp import web
+from storage import JsonStorage, SqliteStorage, atomic_write_json
+from bones import BonesStore, update_bone
+from timeparse import WEEKDAYS, extract_first_time, fast_parse
 sys.stdout.reconfigure(encoding='utf-8')  # ✅ Ensures UTF-8 output
 
-# ✅ Configure logging
-logging.basicConfig(
-    format="[%(asctime)s] %(message)s",
-    level=logging.INFO,
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+# ✅ Startup-time breakdown: (phase, seconds since the previous mark), logged once on the first `on_ready`
+startup_phases = []
+startup_last_mark = STARTUP_STARTED
+
+
+def mark_startup(phase):
+    global startup_last_mark
+    now = time.perf_counter()
+    startup_phases.append((phase, now - startup_last_mark))
+    startup_last_mark = now
+
+
+mark_startup("imports")
+
+load_dotenv()  # ✅ Read `.env` before configuring logging so LOG_LEVEL applies
+
+# ✅ Configure logging: callers only enqueue records; a listener thread formats and writes them in batches
+LOG_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "256"))  # ✅ Max records written per flush
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))  # ✅ Rotate output.log past this size (0 = never)
+LOG_ROTATE_HOURS = float(os.getenv("LOG_ROTATE_HOURS", "24"))  # ✅ ...and on this UTC-aligned interval (0 = never)
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "7"))  # ✅ Compressed archives to keep
+LOG_CONSOLE = os.getenv("LOG_CONSOLE", "1") == "1"  # ✅ Set to 0 under PM2, which already captures stdout into its own log
+EVENTS_FILE = os.getenv("EVENTS_FILE", "events.jsonl")
+EVENTS_LOGGER_NAME = "bbc.events"
+LOG_FORMAT = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+
+# ✅ `emit()` flushes after every record; these handlers leave that to the listener, once per batch
+class BatchFlushMixin:
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+# ✅ output.log -> output.log.1.gz ... output.log.N.gz, rolled by size or on a fixed interval
+class CompressedRotatingFileHandler(BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    def __init__(self, filename, max_bytes, rotate_hours, backup_count):
+        super().__init__(filename, mode="a", maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.interval = rotate_hours * 3600
+        self.rollover_at = self.next_rollover(time.time())
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self.compress
+
+    def next_rollover(self, now):
+        if self.interval <= 0:
+            return None
+        return (now // self.interval + 1) * self.interval  # ✅ Aligned to the epoch, so PM2 restarts don't reset the clock
+
+    def shouldRollover(self, record):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.rollover_at = self.next_rollover(time.time())
+
+    @staticmethod
+    def compress(source, dest):
+        with open(source, "rb") as plain, gzip.open(dest, "wb") as archive:
+            shutil.copyfileobj(plain, archive)
+        os.remove(source)
+
+
+class BatchStreamHandler(BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+# ✅ Skips `QueueHandler.prepare()`, so messages are built on the listener thread, not the event loop
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        return record
+
 
 # ✅ File logging
-file_handler = logging.FileHandler("output.log", encoding="utf-8", mode="a")
-file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
-logging.getLogger().addHandler(file_handler)
+file_handler = CompressedRotatingFileHandler("output.log", LOG_MAX_BYTES, LOG_ROTATE_HOURS, LOG_BACKUP_COUNT)
+file_handler.setFormatter(LOG_FORMAT)
+log_handlers = [file_handler]
 
 # ✅ Console logging (prints logs in PowerShell)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
-logging.getLogger().addHandler(console_handler)
+if LOG_CONSOLE:
+    console_handler = BatchStreamHandler()
+    console_handler.setFormatter(LOG_FORMAT)
+    log_handlers.append(console_handler)
 
-# ✅ Log message function with correct `server_name` integration
-def log_message(interaction_or_system, message, **kwargs):
-    logger = logging.getLogger()
 
-    if isinstance(interaction_or_system, discord.Interaction):
-        # ✅ Use `interaction.command.name` when available, otherwise fallback to function name
-        command_name = interaction_or_system.command.name if interaction_or_system.command else inspect.currentframe().f_back.f_code.co_name
-        server_name = interaction_or_system.guild.name if interaction_or_system.guild else "Direct Message"
-        user_name = interaction_or_system.user.name
-        prefix = f"User {user_name} executed /{command_name} in {server_name}."
-    else:
-        prefix = f"[System] {interaction_or_system}"
+# ✅ Structured event stream: one JSON object per line in events.jsonl (summarize with `python summarize_events.py`)
+class JsonLineFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps(record.msg, ensure_ascii=False, default=str)
+
+
+event_handler = CompressedRotatingFileHandler(EVENTS_FILE, LOG_MAX_BYTES, LOG_ROTATE_HOURS, LOG_BACKUP_COUNT)
+event_handler.setFormatter(JsonLineFormatter())
+event_handlers = [event_handler]
+
+log_queue = queue.SimpleQueue()
 
-    param_details = " | ".join([f"{key}: {value}" for key, value in kwargs.items() if value])
 
-    logger.info(f"{prefix} {message} {param_details}")
+def run_log_listener():
+    while True:
+        record = log_queue.get()
+        if record is None:
+            break
 
-    # ✅ Flush all handlers to ensure logs appear instantly
-    for handler in logging.getLogger().handlers:
-        handler.flush()
+        batch = [record]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                record = log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is None:
+                log_queue.put(None)  # ✅ Finish this batch, then stop
+                break
+            batch.append(record)
+
+        for record in batch:
+            for handler in (event_handlers if record.name == EVENTS_LOGGER_NAME else log_handlers):
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+        for handler in log_handlers + event_handlers:
+            handler.flush_batch()
+
+
+def stop_log_listener():
+    log_queue.put(None)
+    log_listener.join(timeout=5)
+
+
+root_logger = logging.getLogger()
+root_logger.setLevel(LOG_LEVEL)
+root_logger.addHandler(DeferredQueueHandler(log_queue))
+log_listener = threading.Thread(target=run_log_listener, name="bbc-log", daemon=True)
+log_listener.start()
+atexit.register(stop_log_listener)  # ✅ Registered first, so it runs after every other exit hook has logged
+
+events_logger = logging.getLogger(EVENTS_LOGGER_NAME)
+events_logger.setLevel(logging.INFO)  # ✅ Independent of LOG_LEVEL
+events_logger.propagate = False
+events_logger.addHandler(DeferredQueueHandler(log_queue))
+
+
+# ✅ Rendered lazily (on the listener thread) from the pieces `log_message` was given
+class LogMessage:
+    __slots__ = ("source", "command_name", "message", "args", "params")
+
+    def __init__(self, source, command_name, message, args, params):
+        self.source = source
+        self.command_name = command_name
+        self.message = message
+        self.args = args
+        self.params = params
+
+    def __str__(self):
+        if isinstance(self.source, discord.Interaction):
+            server_name = self.source.guild.name if self.source.guild else "Direct Message"
+            if AUTO_SHARD and self.source.guild:
+                server_name += f" (shard {self.source.guild.shard_id})"
+            prefix = f"User {self.source.user.name} executed /{self.command_name} in {server_name}."
+        else:
+            prefix = f"[System] {self.source}"
+
+        message = self.message % self.args if self.args else self.message
+        param_details = " | ".join([f"{key}: {value}" for key, value in self.params.items() if value])
+        return f"{prefix} {message} {param_details}"
+
+
+# ✅ Log message function with correct `server_name` integration.
+# Pass `%`-style args (and `level=logging.DEBUG` on hot paths) so disabled messages are never formatted.
+# Args are formatted later on the listener thread, so pass scalars or copies, never objects the loop keeps mutating.
+def log_message(interaction_or_system, message, *args, level=logging.INFO, **kwargs):
+    if not root_logger.isEnabledFor(level):
+        return
+
+    command_name = None
+    if isinstance(interaction_or_system, discord.Interaction):
+        # ✅ Use `interaction.command.name` when available, otherwise fallback to function name
+        command_name = interaction_or_system.command.name if interaction_or_system.command else sys._getframe(1).f_code.co_name
+
+    root_logger.log(level, LogMessage(interaction_or_system, command_name, message, args, kwargs))
+
+
+# ✅ One JSON-lines record per interaction / background task run
+def record_event(kind, name, started_at, duration, outcome, guild_id=None, user_id=None, **fields):
+    events_logger.info({
+        "type": kind,
+        "name": name,
+        "guild": guild_id,
+        "user": user_id,
+        "start": round(started_at, 3),
+        "end": round(started_at + duration, 3),
+        "duration_ms": round(duration * 1000, 2),
+        "outcome": outcome,
+        **fields,
+    })
+
+
+# ✅ Fixed latency buckets (cumulative, for export) plus a window of recent samples (for percentiles)
+class RollingHistogram:
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 3000, 5000, 10000)
+
+    def __init__(self, window=1000):
+        self.bucket_counts = [0] * (len(self.BUCKETS_MS) + 1)  # ✅ Last slot is +Inf
+        self.count = 0
+        self.total_ms = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value_ms):
+        self.bucket_counts[bisect.bisect_left(self.BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.recent.append(value_ms)
+
+    def percentile(self, pct):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(max(math.ceil(pct / 100 * len(ordered)), 1), len(ordered)) - 1]
+
+
+# ✅ Per-name histograms: wall time, time inside `run_io`, time to first interaction response
+latency_stats = defaultdict(lambda: {"wall": RollingHistogram(), "io": RollingHistogram(), "ttfr": RollingHistogram(), "errors": 0})
+current_timing = contextvars.ContextVar("current_timing", default=None)
+shard_interactions = defaultdict(int)  # ✅ Shard ID -> interactions handled (only counted when sharded)
+INTERACTION_DEADLINE = 3.0  # ✅ Discord drops interactions not acknowledged within 3 seconds
+
+
+# ✅ Notes when the running handler first acknowledges its interaction (send, defer, edit or modal)
+def instrument_interaction_responses():
+    def timed(original):
+        @functools.wraps(original)
+        async def wrapper(self, *args, **kwargs):
+            timing = current_timing.get()
+            result = await original(self, *args, **kwargs)  # ✅ A send that raised (already responded, HTTP error) is no acknowledgement
+            if timing is not None and timing["first_response"] is None:
+                timing["first_response"] = time.perf_counter() - timing["started"]
+            return result
+        return wrapper
+
+    for method_name in ("send_message", "defer", "edit_message", "send_modal"):
+        setattr(discord.InteractionResponse, method_name, timed(getattr(discord.InteractionResponse, method_name)))
+
+
+instrument_interaction_responses()
+
+
+# ✅ Wraps a slash command, component callback or task body: times it, feeds the histograms and records an event
+def tracked(kind):
+    def decorator(func):
+        name = f"/{func.__name__}" if kind == "command" else func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = next((arg for arg in args if isinstance(arg, discord.Interaction)), None)
+            started_at, started = time.time(), time.perf_counter()
+            timing = {"started": started, "io": 0.0, "first_response": None}
+            token = current_timing.set(timing)
+            outcome = "ok"
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                outcome = f"error:{type(e).__name__}"
+                raise
+            finally:
+                current_timing.reset(token)
+                duration = time.perf_counter() - started
+                stats = latency_stats[name]
+                stats["wall"].observe(duration * 1000)
+                stats["io"].observe(timing["io"] * 1000)
+                if outcome != "ok":
+                    stats["errors"] += 1
+
+                fields = {"io_ms": round(timing["io"] * 1000, 2)}
+                if AUTO_SHARD and interaction and interaction.guild:
+                    fields["shard"] = interaction.guild.shard_id
+                    shard_interactions[interaction.guild.shard_id] += 1
+                if timing["first_response"] is not None:
+                    stats["ttfr"].observe(timing["first_response"] * 1000)
+                    fields["ttfr_ms"] = round(timing["first_response"] * 1000, 2)
+                    # ✅ Headroom left on Discord's 3s acknowledgement deadline, measured from interaction creation
+                    acked_at = started_at + timing["first_response"]
+                    fields["deadline_headroom_ms"] = round((interaction.created_at.timestamp() + INTERACTION_DEADLINE - acked_at) * 1000, 1)
+
+                record_event(
+                    kind, name, started_at, duration, outcome,
+                    guild_id=interaction.guild_id if interaction else None,
+                    user_id=interaction.user.id if interaction else None,
+                    **fields,
+                )
+
+        return wrapper
+    return decorator
 
 # Load token from environment variable
-load_dotenv()
 TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 if TOKEN:
     log_message("System", "✅ Token loaded successfully!")
@@ -53,15 +322,61 @@ else:
     log_message("System", "DISCORD_BOT_TOKEN not found!")
 
 
+mark_startup("logging + config")
+
 intents = discord.Intents.default()
 intents.message_content = True  # Enable message content intent
 intents.voice_states = True  # Ensure you have voice intents enabled
 intents.presences = True 
-bot = commands.Bot(command_prefix="/", intents=intents)
+
+AUTO_SHARD = os.getenv("AUTO_SHARD", "0") == "1"  # ✅ Run as `AutoShardedBot` (one gateway connection per shard)
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", "0")) or None  # ✅ Total shards across all processes; unset lets Discord recommend
+SHARD_IDS = [int(shard_id) for shard_id in os.getenv("SHARD_IDS", "").split(",") if shard_id.strip()] or None  # ✅ Shards this process runs; needs SHARD_COUNT
+SETUP_CONCURRENCY = int(os.getenv("SETUP_CONCURRENCY", "5"))  # ✅ Guilds set up at once (roles) during startup
+
+
+class BBCBot(commands.AutoShardedBot if AUTO_SHARD else commands.Bot):
+    metrics_runner = None
+
+    async def setup_hook(self):
+        if METRICS_PORT:
+            self.metrics_runner = await start_metrics_server()  # ✅ Same event loop as the bot; no extra thread
+
+    async def close(self):
+        if self.metrics_runner:
+            await self.metrics_runner.cleanup()
+        await bones_store.compact()  # ✅ Fold the op log into bones.json before shutting down
+        await super().close()
+
+
+if AUTO_SHARD:
+    bot = BBCBot(command_prefix="/", intents=intents, shard_count=SHARD_COUNT, shard_ids=SHARD_IDS)
+else:
+    bot = BBCBot(command_prefix="/", intents=intents)
 
 VOICE_FILE = "voicesettings.json"
 HELP_FILE = "help.json"
+COMMAND_MANIFEST_FILE = "command_manifest.json"
+MOVE_CONCURRENCY = int(os.getenv("MOVE_CONCURRENCY", "5"))  # ✅ Member moves in flight at once for /move and /moveall
+TEMP_CHANNEL_DELETE_CONCURRENCY = int(os.getenv("TEMP_CHANNEL_DELETE_CONCURRENCY", "5"))  # ✅ Deletions in flight during startup reconcile
+TEMP_CHANNEL_GRACE = float(os.getenv("TEMP_CHANNEL_GRACE", "10"))  # ✅ Seconds an empty temp channel survives before deletion; 0 deletes at once
+TEMP_CHANNEL_POOL_SIZE = int(os.getenv("TEMP_CHANNEL_POOL_SIZE", "0"))  # ✅ Hidden spare channels kept per configured guild; 0 disables the pool
+COMMAND_SYNC_CONCURRENCY = int(os.getenv("COMMAND_SYNC_CONCURRENCY", "2"))  # ✅ Parallel guild sync requests
 BONES_FILE = "bones.json"
+BONES_JOURNAL_FILE = "bones.journal"
+BONES_COMPACT_INTERVAL = float(os.getenv("BONES_COMPACT_INTERVAL", "300"))  # ✅ Seconds between snapshot compactions
+USER_TIMEZONES_FILE = "user_timezones.json"
+SQLITE_FILE = os.getenv("SQLITE_FILE", "bbc_bot.db")
+IO_QUEUE_DEPTH = int(os.getenv("IO_QUEUE_DEPTH", "256"))  # ✅ Max storage jobs queued or running at once
+TIME_CACHE_SIZE = int(os.getenv("TIME_CACHE_SIZE", "512"))  # ✅ Max cached timestamp conversions
+TIME_CACHE_TTL = float(os.getenv("TIME_CACHE_TTL", "60"))  # ✅ Seconds a cached conversion stays valid
+WARM_DATEPARSER = os.getenv("WARM_DATEPARSER", "1") == "1"  # ✅ Preload `dateparser` in the background after login
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "1"))  # ✅ Seconds between event-loop lag probes
+SLOW_CALLBACK_MS = float(os.getenv("SLOW_CALLBACK_MS", "250"))  # ✅ Loop stalls longer than this are logged as warnings
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))  # ✅ Serve Prometheus metrics on this port; 0 disables the endpoint
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")  # ✅ Local only by default
+ASYNCIO_DEBUG = os.getenv("ASYNCIO_DEBUG", "0") == "1"  # ✅ Let asyncio name the slow callbacks itself (costly, for diagnosis)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").lower()  # ✅ `json` (default) or `sqlite`
 
 timezones = [
             "UTC-12:00 (Baker Island)", 
@@ -135,10 +450,11 @@ def load_status_messages():
 
 
 @tasks.loop(seconds=1800)
+@tracked("task")
 async def change_status():
     log_message("System", "🔄 Changing bot status...")
     
-    status_messages = load_status_messages()  # ✅ Reloads statuses dynamically
+    status_messages = await run_io(load_status_messages)  # ✅ Reloads statuses dynamically
     if status_messages:  # ✅ Ensures there's at least one status
         new_status = random.choice(status_messages)
         await bot.change_presence(activity=discord.Activity(type=discord.ActivityType.watching, name=new_status))
@@ -159,102 +475,295 @@ bot_file = os.path.join(script_dir, "main.py")  # Builds a platform-independent
 log_message("System", f"🔹 Loading bot from `{bot_file}`")  # ✅ Debugging
 
 
-# Load settings from a JSON file (persists across bot restarts)
-def load_voicesettings():
-    try:
-        with open(VOICE_FILE, "r", encoding="utf-8") as file:
-            voicesettings = json.load(file)
-            log_message("System", f"✅ Loaded voicesettings: {voicesettings}")  # ✅ Log successful load
-            return voicesettings
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        log_message("System", f"⚠️ Error loading voicesettings.json: {e}")
-        return {}
+# ✅ Dedicated I/O thread: keeps file and database work off the event loop.
+# One worker, so storage writes land in the order they were submitted.
+io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bbc-io")
+io_slots = asyncio.Semaphore(IO_QUEUE_DEPTH)  # ✅ Bounded queue depth; extra callers wait here
 
 
-# Save settings to a JSON file (so it persists)
-def save_voicesettings():
+# ✅ Per storage call: latency histogram keyed by the function name (`load_*` / `read_*` count as reads)
+io_stats = defaultdict(RollingHistogram)
+
+
+async def run_io(func, *args):
+    started = time.perf_counter()
     try:
-        unique_servers = {}  # ✅ Ensure unique entries
-        for guild_id, settings in voicesettings.items():
-            unique_servers[str(guild_id)] = settings  # ✅ Convert ID to string to avoid issues
+        async with io_slots:
+            return await asyncio.get_running_loop().run_in_executor(io_executor, functools.partial(func, *args))
+    finally:
+        elapsed = time.perf_counter() - started
+        io_stats[getattr(func, "__name__", "unknown")].observe(elapsed * 1000)
+        timing = current_timing.get()
+        if timing is not None:
+            timing["io"] += elapsed  # ✅ Charged to the command that awaited it
+
+
+# ✅ Storage backend for bones, user timezones and voice settings (`STORAGE_BACKEND=json|sqlite`)
+if STORAGE_BACKEND == "sqlite":
+    storage = SqliteStorage(SQLITE_FILE)
+else:
+    storage = JsonStorage(BONES_FILE, BONES_JOURNAL_FILE, USER_TIMEZONES_FILE, VOICE_FILE)
+log_message("System", f"🗄 Using `{storage.name}` storage backend")
+
+
+# Load settings from storage (persists across bot restarts)
+def load_voicesettings():
+    voicesettings = {str(guild_id): settings for guild_id, settings in storage.load_voicesettings().items()}  # ✅ Always string keys
+    log_message("System", f"✅ Loaded voicesettings: {voicesettings}")  # ✅ Log successful load
+    return voicesettings
+
+
+# ✅ int guild ID -> (lobby channel ID, category ID) for fully configured guilds; what `on_voice_state_update` reads
+lobby_index = {}
+
+
+def index_voicesettings(guild_id):
+    settings = voicesettings.get(str(guild_id), {})
+    lobby_id, category_id = settings.get("LOBBY_CHANNEL_ID"), settings.get("CATEGORY_ID")
+    if lobby_id and category_id:
+        lobby_index[int(guild_id)] = (int(lobby_id), int(category_id))
+    else:
+        lobby_index.pop(int(guild_id), None)
+
+
+def guild_voicesettings(guild_id):
+    return voicesettings.setdefault(str(guild_id), {})  # ✅ Accepts int or str IDs
 
-        with open(VOICE_FILE, "w", encoding="utf-8") as file:
-            json.dump(unique_servers, file, indent=4)
-            log_message("System", f"💾 Saved voicesettings: {unique_servers}")  # ✅ Debugging output
 
-    except IOError as e:
-        log_message("System", f"⚠️ ERROR: Failed to save voicesettings.json! {e}")
+# Save one guild's settings (so it persists); removed guilds are deleted from storage
+async def save_voicesettings(guild_id):
+    settings = voicesettings.get(str(guild_id))
+    index_voicesettings(guild_id)  # ✅ Index first so the next voice event sees the change
+    await run_io(storage.save_voicesettings, str(guild_id), dict(settings) if settings is not None else None)
+    log_message("System", f"💾 Saved voicesettings for `{guild_id}`: {settings}")  # ✅ Debugging output
 
 
 # Load settings when the bot starts
 voicesettings = load_voicesettings()
-# ✅ Store temp voice channels globally
-temporary_channels = {}  # Tracks created voice channels across all servers
+for configured_guild_id in voicesettings:
+    index_voicesettings(configured_guild_id)
+voice_channel_stats = {"created": 0, "deleted": 0, "pool_claims": 0, "rejoins": 0}
+# ✅ Temp voice channels across all servers: channel ID -> (guild ID, category ID, spare), persisted so restarts can clean up
+temporary_channels = storage.load_temp_channels()
+temp_channel_owners = {}  # ✅ Channel ID -> member ID it was created for
+pending_deletions = {}  # ✅ Channel ID -> task waiting out TEMP_CHANNEL_GRACE
+channel_pool = defaultdict(list)  # ✅ Guild ID -> hidden spare channel IDs (tracked in `temporary_channels` with spare=True)
+pool_refills = set()  # ✅ Guild IDs with a refill in flight
+background_tasks = set()  # ✅ Strong references so fire-and-forget tasks aren't garbage collected mid-run
+
+
+def spawn(coro):
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
 
 
 TRIGGER_WORD = "`"  # Change this to the desired trigger word
 channel_id = None  # Stores the selected channel's ID
 
 def load_user_data():
-    try:
-        with open("user_timezones.json", "r", encoding="utf-8") as file:
-            user_data = json.load(file)  # ✅ Load saved timezones
-            log_message("System", f"✅ Loaded user timezones: {user_data}")
-            return user_data
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        log_message("System", f"⚠️ Error loading user timezones: {e}")
-        return {}  # ✅ Return empty dictionary if file is missing or corrupted
+    user_data = storage.load_timezones()  # ✅ Load saved timezones
+    log_message("System", "✅ Loaded %d user timezones: %s", len(user_data), dict(user_data), level=logging.DEBUG)  # ✅ Copy: the map is updated later
+    return user_data
 
-def save_user_data(user_data):
-    try:
-        with open("user_timezones.json", "w", encoding="utf-8") as file:
-            json.dump(user_data, file, indent=4)  # ✅ Save updated timezone data
-            log_message("System", f"💾 Saved user timezones: {user_data}")  # ✅ Debugging confirmation
-    except IOError as e:
-        log_message("System", f"⚠️ ERROR: Failed to write to user_timezones.json! {e}")
+async def save_user_data(user_id, timezone):
+    user_timezones[str(user_id)] = timezone  # ✅ Update the in-memory map first
+    await run_io(storage.save_timezone, user_id, timezone)  # ✅ Upsert just this user's row
+    log_message("System", f"💾 Saved timezone `{timezone}` for user `{user_id}`")  # ✅ Debugging confirmation
+
+
+# ✅ Loaded once; every message afterwards is a dictionary lookup
+user_timezones = load_user_data()
+
+
+def get_user_timezone(user_id):
+    return user_timezones.get(str(user_id), "UTC")  # ✅ Default to UTC if missing
 
 
-# ✅ Load JSON data for bones.json
+# ✅ One `pytz` timezone object per label, built on first use
+@functools.lru_cache(maxsize=None)
+def resolve_timezone(user_timezone):
+    return pytz.timezone(valid_timezones.get(user_timezone, "UTC"))
+
+
+bones_store = BonesStore(storage, run_io)
+mark_startup("storage load")
+atexit.register(bones_store.compact_at_exit)  # ✅ Last-chance compaction if the process exits without `bot.close()`
+
+
+# ✅ Load JSON data for bones.json (served from memory)
 def load_json():
-    try:
-        with open(BONES_FILE, "r", encoding="utf-8") as file:
-            data = json.load(file)
+    return bones_store.data
 
-            if not isinstance(data, dict):  # ✅ Ensure it's structured correctly
-                log_message("System", f"⚠️ ERROR: Expected dictionary, got {type(data)}! Fixing...")
-                return {}
 
-            log_message("System", f"✅ Loaded bones.json successfully.")  # ✅ Log success
-            return data  # ✅ Store data per guild
+# ✅ One lock per (guild, domain): mutations queue up in arrival order within a guild, other guilds run in parallel
+guild_locks = defaultdict(asyncio.Lock)
 
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        log_message("System", f"⚠️ ERROR: Failed to load bones.json! {e}")
-        return {}  # ✅ Return an empty dictionary if file is missing or corrupted
 
-# ✅ Save JSON data to bones.json
-def save_json(guild_id, key, value):
-    data = load_json()  # ✅ Load current data
+def guild_lock(guild_id, domain):
+    return guild_locks[(str(guild_id), domain)]
 
-    if value is None:  # ✅ Handle deletion properly
-        if guild_id in data and key in data[guild_id]:
-            del data[guild_id][key]  # ✅ Remove specific name
-            log_message("System", f"✅ DELETED `{key}` from `{guild_id}`!")
 
-            if not data[guild_id]:  # ✅ If last entry removed, delete guild
-                del data[guild_id]
-                log_message("System", f"🗑 Removed empty guild `{guild_id}`!")
+@tasks.loop(seconds=BONES_COMPACT_INTERVAL)
+@tracked("task")
+async def compact_bones():
+    await bones_store.compact()  # ✅ Folds the op log back into bones.json
 
-    else:  # ✅ Store updated values
-        if guild_id not in data:
-            data[guild_id] = {}  
-        data[guild_id][key] = value  # ✅ Ensure correct update
 
-    try:
-        with open(BONES_FILE, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)  
-            log_message("System", f"💾 Saved updated bones.json data: {data}")  # ✅ Ensure it’s written correctly
-    except IOError as e:
-        log_message("System", f"⚠️ ERROR: Failed to write to bones.json! {e}")
+# ✅ Event-loop lag: how late a short sleep wakes up, i.e. how long other callbacks held the loop
+loop_health = {
+    "lag": RollingHistogram(window=600),
+    "last_lag_ms": 0.0,
+    "max_lag_ms": 0.0,
+    "stalls": 0,
+    "gateway_ms": None,
+    "pending_tasks": 0,
+    "samples": 0,
+}
+
+
+@tasks.loop(seconds=LOOP_LAG_INTERVAL)
+async def measure_loop_lag():
+    probe = 0.05
+    started = time.perf_counter()
+    await asyncio.sleep(probe)
+    lag_ms = max((time.perf_counter() - started - probe) * 1000, 0.0)
+
+    loop_health["lag"].observe(lag_ms)
+    loop_health["last_lag_ms"] = lag_ms
+    loop_health["max_lag_ms"] = max(loop_health["max_lag_ms"], lag_ms)
+    loop_health["pending_tasks"] = len(asyncio.all_tasks())
+    loop_health["gateway_ms"] = bot.latency * 1000 if math.isfinite(bot.latency) else None  # ✅ inf/nan until the first heartbeat ack
+    loop_health["samples"] += 1
+
+    if lag_ms >= SLOW_CALLBACK_MS:
+        loop_health["stalls"] += 1
+        log_message(
+            "System", "⚠️ Event loop stalled for %.0f ms (threshold %.0f ms, %d pending tasks)",
+            lag_ms, SLOW_CALLBACK_MS, loop_health["pending_tasks"], level=logging.WARNING
+        )
+
+    if loop_health["samples"] % 60 == 0:  # ✅ Summary roughly once a minute at the default interval
+        gateway = f"{loop_health['gateway_ms']:.0f} ms" if loop_health["gateway_ms"] is not None else "n/a"
+        log_message(
+            "System", "⏱ Loop health: lag p95 %.1f ms, max %.1f ms, stalls %d, gateway %s, %d pending tasks",
+            loop_health["lag"].percentile(95), loop_health["max_lag_ms"], loop_health["stalls"], gateway, loop_health["pending_tasks"]
+        )
+
+
+@measure_loop_lag.before_loop
+async def enable_asyncio_debug():
+    if ASYNCIO_DEBUG:
+        loop = asyncio.get_running_loop()
+        loop.slow_callback_duration = SLOW_CALLBACK_MS / 1000
+        loop.set_debug(True)  # ✅ asyncio logs "Executing <Handle ...> took X seconds" for each slow callback
+
+
+# ✅ Prometheus text exposition of the counters and histograms collected above
+def prometheus_histogram(lines, metric, histogram, labels=""):
+    cumulative = 0
+    for bound, count in zip(RollingHistogram.BUCKETS_MS, histogram.bucket_counts):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{labels}{"," if labels else ""}le="{bound / 1000:g}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{{labels}{"," if labels else ""}le="+Inf"}} {histogram.count}')
+    label_block = f"{{{labels}}}" if labels else ""
+    lines.append(f"{metric}_sum{label_block} {histogram.total_ms / 1000:.6f}")
+    lines.append(f"{metric}_count{label_block} {histogram.count}")
+
+
+def render_metrics():
+    lines = [
+        "# HELP bbc_handler_duration_seconds Wall time of commands, component callbacks and tasks.",
+        "# TYPE bbc_handler_duration_seconds histogram",
+    ]
+    for name, entry in latency_stats.items():
+        prometheus_histogram(lines, "bbc_handler_duration_seconds", entry["wall"], f'name="{name}"')
+
+    lines += ["# HELP bbc_handler_errors_total Handler runs that raised.", "# TYPE bbc_handler_errors_total counter"]
+    lines += [f'bbc_handler_errors_total{{name="{name}"}} {entry["errors"]}' for name, entry in latency_stats.items()]
+
+    lines += ["# HELP bbc_interaction_ack_seconds Time from handler start to first interaction response.",
+              "# TYPE bbc_interaction_ack_seconds histogram"]
+    for name, entry in latency_stats.items():
+        if entry["ttfr"].count:
+            prometheus_histogram(lines, "bbc_interaction_ack_seconds", entry["ttfr"], f'name="{name}"')
+
+    lines += ["# HELP bbc_storage_duration_seconds Storage calls run through the I/O executor.",
+              "# TYPE bbc_storage_duration_seconds histogram"]
+    for name, histogram in io_stats.items():
+        kind = "read" if name.startswith(("load", "read")) else "write"
+        prometheus_histogram(lines, "bbc_storage_duration_seconds", histogram, f'op="{name}",kind="{kind}"')
+
+    lines += ["# HELP bbc_bones_writes_total Bones writes requested by handlers and performed against storage.",
+              "# TYPE bbc_bones_writes_total counter",
+              f'bbc_bones_writes_total{{stage="requested"}} {bones_store.writes_requested}',
+              f'bbc_bones_writes_total{{stage="performed"}} {bones_store.writes_performed}']
+
+    lines += ["# HELP bbc_time_conversions_total Time conversions by parser path and result.",
+              "# TYPE bbc_time_conversions_total counter"]
+    for key, value in time_parse_stats.items():
+        parser, result = key.split("_")
+        lines.append(f'bbc_time_conversions_total{{parser="{parser}",result="{"hit" if result == "hits" else "miss"}"}} {value}')
+
+    lines += ["# HELP bbc_time_cache_total Time-conversion cache lookups and removals.",
+              "# TYPE bbc_time_cache_total counter",
+              f'bbc_time_cache_total{{event="hit"}} {timestamp_cache.hits}',
+              f'bbc_time_cache_total{{event="miss"}} {timestamp_cache.misses}',
+              f'bbc_time_cache_total{{event="eviction"}} {timestamp_cache.evictions}',
+              f'bbc_time_cache_total{{event="expiration"}} {timestamp_cache.expirations}',
+              "# HELP bbc_page_cache_total Rendered /showbones page lookups.",
+              "# TYPE bbc_page_cache_total counter",
+              f'bbc_page_cache_total{{event="hit"}} {rendered_pages.hits}',
+              f'bbc_page_cache_total{{event="miss"}} {rendered_pages.misses}',
+              "# TYPE bbc_time_cache_entries gauge",
+              f"bbc_time_cache_entries {len(timestamp_cache.entries)}"]
+
+    lines += ["# HELP bbc_temp_voice_channels_total Temporary voice channels created and deleted.",
+              "# TYPE bbc_temp_voice_channels_total counter",
+              f'bbc_temp_voice_channels_total{{event="created"}} {voice_channel_stats["created"]}',
+              f'bbc_temp_voice_channels_total{{event="deleted"}} {voice_channel_stats["deleted"]}',
+              f'bbc_temp_voice_channels_total{{event="pool_claim"}} {voice_channel_stats["pool_claims"]}',
+              f'bbc_temp_voice_channels_total{{event="rejoin"}} {voice_channel_stats["rejoins"]}',
+              "# TYPE bbc_temp_voice_channels gauge",
+              f"bbc_temp_voice_channels {len(temporary_channels)}",
+              "# TYPE bbc_temp_voice_channels_pooled gauge",
+              f"bbc_temp_voice_channels_pooled {sum(len(pool) for pool in channel_pool.values())}"]
+
+    lines += ["# HELP bbc_loop_lag_seconds Event-loop scheduling lag.", "# TYPE bbc_loop_lag_seconds histogram"]
+    prometheus_histogram(lines, "bbc_loop_lag_seconds", loop_health["lag"])
+    lines += ["# TYPE bbc_loop_stalls_total counter", f"bbc_loop_stalls_total {loop_health['stalls']}",
+              "# TYPE bbc_pending_tasks gauge", f"bbc_pending_tasks {loop_health['pending_tasks']}"]
+    if loop_health["gateway_ms"] is not None:
+        lines += ["# HELP bbc_gateway_latency_seconds Gateway heartbeat latency.",
+                  "# TYPE bbc_gateway_latency_seconds gauge",
+                  f"bbc_gateway_latency_seconds {loop_health['gateway_ms'] / 1000:.6f}"]
+    lines += ["# TYPE bbc_guilds gauge", f"bbc_guilds {len(bot.guilds)}"]
+    if AUTO_SHARD:
+        guilds_per_shard = defaultdict(int)
+        for guild in bot.guilds:
+            guilds_per_shard[guild.shard_id] += 1
+        lines += ["# HELP bbc_shard_latency_seconds Gateway heartbeat latency per shard.", "# TYPE bbc_shard_latency_seconds gauge"]
+        lines += [f'bbc_shard_latency_seconds{{shard="{shard_id}"}} {latency:.6f}' for shard_id, latency in bot.latencies if math.isfinite(latency)]
+        lines += ["# TYPE bbc_shard_guilds gauge"]
+        lines += [f'bbc_shard_guilds{{shard="{shard_id}"}} {count}' for shard_id, count in sorted(guilds_per_shard.items())]
+        lines += ["# HELP bbc_shard_interactions_total Interactions handled per shard.", "# TYPE bbc_shard_interactions_total counter"]
+        lines += [f'bbc_shard_interactions_total{{shard="{shard_id}"}} {count}' for shard_id, count in sorted(shard_interactions.items())]
+    return "\n".join(lines) + "\n"
+
+
+async def handle_metrics(request):
+    return web.Response(text=render_metrics(), content_type="text/plain", charset="utf-8")
+
+
+async def start_metrics_server():
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, METRICS_HOST, METRICS_PORT).start()
+    log_message("System", f"📈 Metrics endpoint listening on http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+    return runner
 
 
 def load_commands():
@@ -278,33 +787,83 @@ def load_commands():
         return []
 
 
-async def force_reset_commands():
-    await bot.wait_until_ready()
+# ✅ Command manifest: hashes of what was last synced, so unchanged trees are never re-synced
+def load_command_manifest():
+    try:
+        with open(COMMAND_MANIFEST_FILE, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+            if isinstance(manifest, dict):
+                return manifest
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        log_message("System", f"⚠️ No usable command manifest ({e}). Everything will be synced once.")
+    return {}
 
-    log_message("System", "🛠 Forcefully removing all registered commands from Discord API...")
 
-    if not bot.guilds:
-        log_message("System", "⚠️ Bot is not in any servers. Cannot reset commands.")
-        return  
+def save_command_manifest(manifest):
+    try:
+        atomic_write_json(COMMAND_MANIFEST_FILE, manifest)
+    except (IOError, OSError) as e:
+        log_message("System", f"⚠️ ERROR: Failed to write `{COMMAND_MANIFEST_FILE}`! {e}")
 
-    log_message("System", f"🔍 Bot is currently in {len(bot.guilds)} guilds.")
 
-    for guild in bot.guilds:
-        if not isinstance(guild, discord.Guild):  
-            log_message("System", f"⚠️ Skipping invalid guild object: {guild}")
-            continue  
+def command_tree_hash(guild=None, commands_data=None):
+    payload = {
+        "tree": sorted((cmd.to_dict(bot.tree) for cmd in bot.tree.get_commands(guild=guild)), key=lambda cmd: cmd["name"]),
+        "commands_json": commands_data if guild is None else None,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
 
-        log_message("System", f"🔍 Processing guild: `{guild.name}` ({guild.id})")  
 
-        try:
-            bot.tree.clear_commands(guild=guild)  # ✅ Attempt to remove commands
-            await asyncio.sleep(1)  # ✅ Short delay between API calls to prevent rate limiting
-            log_message("System", f"✅ Commands cleared for `{guild.name}` ({guild.id})")
+# ✅ Only syncs the global tree / guild trees whose hash changed since the last successful sync
+manifest_lock = asyncio.Lock()  # ✅ Shards sync concurrently; manifest updates are merged one at a time
 
-        except Exception as e:
-            log_message("System", f"⚠️ Error clearing commands for `{guild.name}`: {e}")
 
-    log_message("System", "✅ Successfully removed all server-specific commands.")
+async def sync_changed_commands(commands_data, guilds, sync_global=True):
+    manifest = await run_io(load_command_manifest)
+    known_guilds = manifest.get("guilds", {})
+    global_update, guild_updates = None, {}
+
+    if sync_global:  # ✅ Per-shard setup only touches its own guilds; `on_ready` owns the global tree
+        global_hash = command_tree_hash(commands_data=commands_data)
+        if manifest.get("global") != global_hash:
+            try:
+                synced = await bot.tree.sync()
+                global_update = global_hash
+                log_message("System", f"✅ Synced {len(synced)} commands globally! Synced Commands: {[cmd.name for cmd in synced]}")
+            except (discord.HTTPException, discord.app_commands.errors.CommandSyncFailure) as e:
+                log_message("System", f"⚠️ Command sync failed: {e}")
+        else:
+            log_message("System", "✅ Global commands unchanged. Skipping sync.")
+
+    # ✅ Guild trees are normally empty; syncing an empty tree clears stale server-specific commands
+    sync_slots = asyncio.Semaphore(COMMAND_SYNC_CONCURRENCY)
+
+    async def sync_guild(guild):
+        guild_hash = command_tree_hash(guild=guild)
+        if known_guilds.get(str(guild.id)) == guild_hash:
+            return False
+
+        async with sync_slots:  # ✅ discord.py waits out 429s per route bucket; this just caps parallel requests
+            try:
+                await bot.tree.sync(guild=guild)
+                guild_updates[str(guild.id)] = guild_hash
+                log_message("System", f"✅ Synced commands for `{guild.name}` ({guild.id})")
+                return True
+            except discord.HTTPException as e:
+                log_message("System", f"⚠️ Error syncing commands for `{guild.name}`: {e}")
+                return False
+
+    if guilds:
+        results = await asyncio.gather(*(sync_guild(guild) for guild in guilds))
+        log_message("System", f"🔍 Guild command sync: {sum(results)} of {len(guilds)} guilds changed.")
+
+    if global_update or guild_updates:
+        async with manifest_lock:
+            manifest = await run_io(load_command_manifest)  # ✅ Re-read so another shard's updates aren't overwritten
+            if global_update:
+                manifest["global"] = global_update
+            manifest.setdefault("guilds", {}).update(guild_updates)
+            await run_io(save_command_manifest, manifest)
 
 
 async def command_function(interaction: discord.Interaction, command_name: str):
@@ -324,7 +883,7 @@ async def register_commands():
 
     log_message("System", "🛠 Registering commands before syncing...")
 
-    commands_data = load_commands()
+    commands_data = await run_io(load_commands)
     existing_commands = {cmd.name for cmd in bot.tree.get_commands()}
 
     for cmd in commands_data:
@@ -345,56 +904,101 @@ async def register_commands():
                     callback=dynamic_command
                 ))
 
-                await asyncio.sleep(0.5)  # ✅ Add slight delay to prevent rate limiting
-
             except Exception as e:
                 log_message("System", f"⚠️ Failed to add `{cmd['name']}`: {e}")
 
     log_message("System", f"✅ Commands registered before sync: {[cmd.name for cmd in bot.tree.get_commands()]}")
 
-    try:
-        await asyncio.sleep(1)  # ✅ Extra delay before syncing globally
-        synced = await bot.tree.sync()  # ✅ Only sync here
-        log_message("System", f"✅ Synced {len(synced)} commands globally! Synced Commands: {[cmd.name for cmd in synced]}")
+    await sync_changed_commands(commands_data, [])  # ✅ Global tree only; guild trees sync per shard in `setup_guilds`
 
-    except discord.app_commands.errors.CommandSyncFailure as e:
-        log_message("System", f"⚠️ Command sync failed: {e}")
 
+async def setup_roles(guilds):
+    setup_slots = asyncio.Semaphore(SETUP_CONCURRENCY)
 
-async def setup_roles():
-    for guild in bot.guilds:  
-        log_message("System", f"🔍 Checking roles in `{guild.name}`...")
-        roles = [role.name for role in guild.roles]
-        log_message("System", f"📜 Available Roles: {roles}")
+    async def setup_guild_role(guild):
+        async with setup_slots:
+            log_message("System", f"🔍 Checking roles in `{guild.name}`...")
+            roles = [role.name for role in guild.roles]
+            log_message("System", f"📜 Available Roles: {roles}")
 
-        role_name = "bbc"
-        role = discord.utils.get(guild.roles, name=role_name)
-        member = guild.get_member(bot.user.id) or await guild.fetch_member(bot.user.id)
+            role_name = "bbc"
+            role = discord.utils.get(guild.roles, name=role_name)
+            member = guild.get_member(bot.user.id) or await guild.fetch_member(bot.user.id)
 
-        if role and member:
-            if role in member.roles:
-                log_message("System", f"✅ Bot already has `{role.name}` in `{guild.name}`")
+            if role and member:
+                if role in member.roles:
+                    log_message("System", f"✅ Bot already has `{role.name}` in `{guild.name}`")
+                else:
+                    try:
+                        await member.add_roles(role)
+                        log_message("System", f"✅ Assigned `{role.name}` to bot in `{guild.name}`")
+                    except discord.Forbidden:
+                        log_message("System", f"⚠️ Missing Permissions! Bot lacks `Manage Roles` in `{guild.name}`.")
             else:
-                try:
-                    await member.add_roles(role)
-                    log_message("System", f"✅ Assigned `{role.name}` to bot in `{guild.name}`")
-                except discord.Forbidden:
-                    log_message("System", f"⚠️ Missing Permissions! Bot lacks `Manage Roles` in `{guild.name}`.")
-        else:
-            log_message("System", f"⚠️ Role `{role_name}` or bot member not found in `{guild.name}`.")
+                log_message("System", f"⚠️ Role `{role_name}` or bot member not found in `{guild.name}`.")
+
+    await asyncio.gather(*(setup_guild_role(guild) for guild in guilds))
+
+
+# ✅ Everything that runs once per guild at startup: guild command sync, bot role, temp channel cleanup, channel pool
+async def setup_guilds(guilds, label):
+    started = time.perf_counter()
+    await sync_changed_commands(await run_io(load_commands), guilds, sync_global=False)
+    await setup_roles(guilds)
+    await reconcile_temp_channels({guild.id for guild in guilds})
+    if TEMP_CHANNEL_POOL_SIZE:
+        for guild in guilds:
+            if guild.id in lobby_index:
+                spawn(refill_channel_pool(guild))  # ✅ Pre-create spare lobby channels
+    log_message("System", f"✅ Setup for {label} done: {len(guilds)} guilds in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+shards_set_up = set()  # ✅ Shard IDs whose guilds went through `setup_guilds`
+
+
+# ✅ Sharded mode only: each shard sets up its own guilds as soon as it is ready, in parallel with the others
+@bot.event
+async def on_shard_ready(shard_id):
+    log_message("System", f"✅ Shard {shard_id} ready")
+    if shard_id in shards_set_up:
+        return  # ✅ New session after a reconnect
+    shards_set_up.add(shard_id)
+    await setup_guilds([guild for guild in bot.guilds if guild.shard_id == shard_id], f"shard {shard_id}")
+
+
+bot_setup_done = False  # ✅ `on_ready` fires again on every gateway reconnect
 
 
 @bot.event
 async def on_ready():
+    global bot_setup_done
     log_message("System", f'✅ Bot is now online as {bot.user}')
+
+    if bot_setup_done:
+        log_message("System", "🔄 Reconnected to the gateway. Setup already ran in this process; skipping.")
+        return
+    bot_setup_done = True  # ✅ Set before awaiting so a reconnect mid-setup can't start a second run
+
+    mark_startup("login + gateway")
+    breakdown = " | ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in startup_phases)
+    log_message("System", f"⏱ Startup: {breakdown} | total {(time.perf_counter() - STARTUP_STARTED) * 1000:.0f} ms")
+
+    if WARM_DATEPARSER:
+        warm_dateparser()  # ✅ Off the event loop; the first fallback parse won't pay the import
     
-    await force_reset_commands()  # ✅ Ensure outdated commands are removed first
-    await register_commands()  # ✅ Register and sync new commands
-    await setup_roles()  # ✅ Run role setup separately  
+    await register_commands()  # ✅ Register commands and sync only what changed
+    if not AUTO_SHARD:
+        await setup_guilds(bot.guilds, "all guilds")  # ✅ Sharded runs do this per shard in `on_shard_ready`
     
     if not change_status.is_running(): 
         change_status.start() # ✅ Ensures the loop starts only once
 
+    if not compact_bones.is_running():
+        compact_bones.start()  # ✅ Background compaction of the bones op log
+
+    if not measure_loop_lag.is_running():
+        measure_loop_lag.start()  # ✅ Event-loop lag metric
+
     log_message("System", "🎯 Bot setup complete. Ready for interactions!")
 
 
@@ -408,8 +1012,7 @@ async def on_guild_join(guild):
             "✨ **Check out what I can do by using** `/help` ✨"
         )
 
-    await bot.tree.sync(guild=guild)  # ✅ Sync commands for the specific guild
-    log_message("System", f"✅ Synced commands for `{guild.name}`!")
+    await sync_changed_commands(await run_io(load_commands), [guild])  # ✅ Sync commands for the specific guild (if needed)
 
 
 @bot.event
@@ -417,26 +1020,57 @@ async def on_guild_remove(guild):
     log_message("System", f"⚠️ Bot was removed from `{guild.name}` (ID: `{guild.id}`)")
     log_message("System", f"🔍 Checking voicesettings before cleanup... {voicesettings}")
 
-    if guild.id in voicesettings:
+    if str(guild.id) in voicesettings:
         log_message("System", f"🔄 Cleaning up settings for `{guild.name}`...")
-        del voicesettings[guild.id]  # ✅ Remove voice settings
-        save_voicesettings()  # ✅ Persist changes
+        del voicesettings[str(guild.id)]  # ✅ Remove voice settings
+        await save_voicesettings(guild.id)  # ✅ Persist changes
         log_message("System", f"✅ Cleanup complete for `{guild.name}`.")
     else:
         log_message("System", f"⚠️ Guild ID `{guild.id}` NOT found in voicesettings. No action taken.")
 
 
-def convert_to_timestamp(extracted_time, format_style, user_timezone="America/New_York"):
-    try:
-        parsed_time = dateparser.parse(extracted_time, settings={"RELATIVE_BASE": datetime.now()})  # ✅ Parses relative time
+# ✅ `dateparser` costs hundreds of ms to import, so it loads on the first fallback parse (or is warmed after `on_ready`)
+dateparser = None
+dateparser_lock = threading.Lock()
+
+
+def load_dateparser():
+    global dateparser
+    with dateparser_lock:
+        if dateparser is None:
+            started = time.perf_counter()
+            import dateparser as dateparser_module
+            dateparser_module.parse("tomorrow at noon")  # ✅ First parse loads the language data too
+            dateparser = dateparser_module
+            log_message("System", f"📦 Loaded `dateparser` in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return dateparser
+
 
-        if parsed_time is None:  
-            log_message("System", f"⚠️ Failed to parse time: `{extracted_time}`")
-            return "⚠️ Unable to process the given time format."
+def warm_dateparser():
+    threading.Thread(target=load_dateparser, name="bbc-warm-dateparser", daemon=True).start()
 
+
+# ✅ Which parser answered each conversion (fast path vs `dateparser` fallback)
+time_parse_stats = {"fast_hits": 0, "fast_misses": 0, "dateparser_hits": 0, "dateparser_misses": 0}
+
+
+def convert_to_timestamp_uncached(extracted_time, format_style, user_timezone="America/New_York"):
+    try:
         # Convert stored user timezone to a valid `pytz` format
-        pytz_timezone = valid_timezones.get(user_timezone, "UTC")  
-        tz = pytz.timezone(pytz_timezone)  
+        tz = resolve_timezone(user_timezone)  
+
+        parsed_time = fast_parse(extracted_time, datetime.now(tz).replace(tzinfo=None))  # ✅ Common forms, no `dateparser`
+        if parsed_time is not None:
+            time_parse_stats["fast_hits"] += 1
+        else:
+            time_parse_stats["fast_misses"] += 1
+            parsed_time = load_dateparser().parse(extracted_time, settings={"RELATIVE_BASE": datetime.now()})  # ✅ Parses relative time
+
+            if parsed_time is None:  
+                time_parse_stats["dateparser_misses"] += 1
+                log_message("System", f"⚠️ Failed to parse time: `{extracted_time}`")
+                return "⚠️ Unable to process the given time format."
+            time_parse_stats["dateparser_hits"] += 1
 
         if parsed_time.tzinfo is None:
             parsed_time = tz.localize(parsed_time)  
@@ -448,64 +1082,100 @@ def convert_to_timestamp(extracted_time, format_style, user_timezone="America/Ne
             return f"📅 `{parsed_time.strftime('%A, %B %d, %Y')}`"
 
         formatted_timestamp = f"<t:{int(parsed_time.timestamp())}:{format_style}>"
-        log_message("System", f"✅ Converted `{extracted_time}` to `{formatted_timestamp}` in `{user_timezone}`")
+        log_message("System", "✅ Converted `%s` to `%s` in `%s`", extracted_time, formatted_timestamp, user_timezone, level=logging.DEBUG)
         return formatted_timestamp
 
     except Exception as e:
         log_message("System", f"⚠️ Timestamp conversion error: {e}")
         return "⚠️ An error occurred while converting the timestamp."
 
+
+# ✅ Bounded LRU with per-entry expiry
+class LRUCache:
+    def __init__(self, capacity, ttl):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.entries = OrderedDict()  # ✅ key -> (expires_at, value), oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)  # ✅ Mark as most recently used
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)  # ✅ Drop the least recently used entry
+            self.evictions += 1
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+timestamp_cache = LRUCache(TIME_CACHE_SIZE, TIME_CACHE_TTL)
+
+
+# ✅ Cached conversion: keyed by normalized text, timezone, format and the current minute so relative times stay correct
+def convert_to_timestamp(extracted_time, format_style, user_timezone="America/New_York"):
+    normalized = " ".join(extracted_time.lower().split())
+    key = (normalized, user_timezone, format_style, int(time.time() // 60))
+
+    formatted_timestamp = timestamp_cache.get(key)
+    if formatted_timestamp is None:
+        formatted_timestamp = convert_to_timestamp_uncached(extracted_time, format_style, user_timezone)
+        timestamp_cache.put(key, formatted_timestamp)
+    return formatted_timestamp
+
  
 @bot.event
 async def on_message(message):
     if message.author.bot:
         return  # ✅ Ignore bot messages
     
-    log_message("System", f"🔹 Message received from {message.author.name}: {message.content}")  # ✅ Log incoming message
-    
-    extracted_time = None  # ✅ Initialize variable to prevent UnboundLocalError
+    log_message("System", "🔹 Message received from %s: %s", message.author.name, message.content, level=logging.DEBUG)  # ✅ Log incoming message
     
-    # Your extraction logic...
-    
-    if extracted_time:  # ✅ No more UnboundLocalError
-        log_message("System", f"✅ Extracted time: {extracted_time}")
-
-    # Improved regex to detect timestamps or natural language inputs
-    match = re.search(r"\b(?:\d{1,2}:\d{2}(?:\s?[APap][Mm])?)\b", message.content) or \
-            re.search(r"'([\w\d\-/: ]+)'", message.content) or \
-            re.search(r"\b(?:tomorrow|next|in|on|this)?\s?(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)?\s?(\d{1,2}(?::\d{2})?\s?[APap][Mm]?)?", message.content, re.I)
+    span = extract_first_time(message.content)  # ✅ One precompiled pass, prefiltered
+    if not span:
+        return  # ✅ No time expression in this message
 
-    if match:
-        extracted_time = match.group(0)  # ✅ Ensure `group()` is called explicitly
-        
-        if isinstance(extracted_time, str):
-            words = extracted_time.lower().split()
-        else:
-            log_message("System", f"⚠️ ERROR: Invalid extracted_time -> {extracted_time}")
-            return  # ✅ Stop execution if extraction failed
+    extracted_time = span.text
+    log_message("System", f"✅ Extracted time: {extracted_time} ({span.kind})")
 
+    if span.modifier == "next" and span.weekday and span.clock is None:  # ✅ A clock goes through `convert_to_timestamp` below
         today = date.today()
-        words = extracted_time.lower().split()
-
-        if "next" in words:
-            for day, index in weekdays.items():
-                if day.lower() in words:
-                    target_weekday = index
-                    days_ahead = (target_weekday - today.weekday() + 7) % 7 or 7
-                    parsed_time = today + timedelta(days=days_ahead)
-                    await message.channel.send(f"📅 Date detected: `{parsed_time.strftime('%A, %B %d, %Y')}`")
-                    return
+        target_weekday = WEEKDAYS.index(span.weekday)
+        days_ahead = (target_weekday - today.weekday() + 7) % 7 or 7
+        parsed_time = today + timedelta(days=days_ahead)
+        await message.channel.send(f"📅 Date detected: `{parsed_time.strftime('%A, %B %d, %Y')}`")
+        return
                 
     if extracted_time:
-        async def get_user_timezone(user_id):
-            user_data = load_user_data()  
-            timezone = user_data.get(str(user_id), "UTC")  # ✅ Default to UTC if missing
-            return timezone
-        
-        user_timezone = await get_user_timezone(message.author.id)  # ✅ Fetch per-user timezone
+        user_timezone = get_user_timezone(message.author.id)  # ✅ Fetch per-user timezone
         formatted_timestamp = convert_to_timestamp(extracted_time, "F", user_timezone)  # ✅ Pass timezone
 
-        if formatted_timestamp:
+        if formatted_timestamp and formatted_timestamp.startswith("⚠️") and span.kind != "quoted":
+            log_message("System", "⚠️ Could not convert guessed time `%s`; staying quiet", extracted_time, level=logging.DEBUG)
+            return  # ✅ Only an explicitly quoted time gets an error reply in chat
+        elif formatted_timestamp:
             log_message("System", f"✅ Converted `{extracted_time}` to `{formatted_timestamp}` in `{user_timezone}`")  # ✅ Log conversion
             await message.channel.send(f"📅 Converted Time ({user_timezone}): {formatted_timestamp}")
         else:
@@ -523,6 +1193,7 @@ class TimezoneDropdown(discord.ui.Select):
         super().__init__(placeholder="Select your timezone (UTC offset + major city)", min_values=1, max_values=1, options=options)
         self.selected_timezone = None
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, f"✅ User selected timezone: {self.values[0]}")  # ✅ Log timezone selection
         
@@ -544,12 +1215,10 @@ class ConfirmTimezoneButton(discord.ui.Button):
         self.user_id = str(user_id)  # ✅ Store user ID
         self.dropdown = dropdown  # ✅ Reference the dropdown instance
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         selected_timezone = self.dropdown.selected_timezone  # ✅ Get confirmed timezone
-        user_data = load_user_data()
-
-        user_data[self.user_id] = selected_timezone  # ✅ Save to user database
-        save_user_data(user_data)  # ✅ Persist changes
+        await save_user_data(self.user_id, selected_timezone)  # ✅ Persist changes
 
         log_message(interaction, f"✅ Timezone updated to {selected_timezone}")  # ✅ Log timezone update
 
@@ -562,6 +1231,7 @@ class ConfirmTimezoneButton(discord.ui.Button):
         await interaction.response.edit_message(embed=embed, view=None)  # ✅ Remove buttons after saving
 
 @bot.tree.command(name="settimezone", description="Set your timezone using a dropdown menu")
+@tracked("command")
 async def settimezone(interaction: discord.Interaction):
     log_message(interaction, "🔹 Command initiated: Set Timezone")  # ✅ Log command execution
 
@@ -571,8 +1241,76 @@ async def settimezone(interaction: discord.Interaction):
     await interaction.response.send_message("🌍 Select your timezone:", view=view, ephemeral=True)
 
 
+@bot.tree.command(name="cachestats", description="Show time-conversion cache statistics (admin only)")
+@app_commands.default_permissions(administrator=True)
+@tracked("command")
+async def cachestats(interaction: discord.Interaction):
+    log_message(interaction, "🔹 Command initiated: Cache Stats")  # ✅ Log command execution
+
+    embed = discord.Embed(title="🗃 Time Conversion Cache", color=discord.Color(0x7eff00))
+    embed.add_field(name="Hit rate", value=f"{timestamp_cache.hit_rate * 100:.1f}%", inline=True)
+    embed.add_field(name="Hits / Misses", value=f"{timestamp_cache.hits} / {timestamp_cache.misses}", inline=True)
+    embed.add_field(name="Entries", value=f"{len(timestamp_cache.entries)} / {timestamp_cache.capacity}", inline=True)
+    embed.add_field(name="Evictions / Expirations", value=f"{timestamp_cache.evictions} / {timestamp_cache.expirations}", inline=True)
+    embed.add_field(name="TTL", value=f"{timestamp_cache.ttl:g}s", inline=True)
+    embed.add_field(
+        name="Parser paths",
+        value=f"fast {time_parse_stats['fast_hits']} hit / {time_parse_stats['fast_misses']} miss, "
+              f"dateparser {time_parse_stats['dateparser_hits']} hit / {time_parse_stats['dateparser_misses']} miss",
+        inline=False
+    )
+    embed.add_field(
+        name="Leaderboard pages",
+        value=f"{rendered_pages.hits} hit / {rendered_pages.misses} rendered across {len(rendered_pages.guilds)} guilds",
+        inline=False
+    )
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+@bot.tree.command(name="stats", description="Show command latency histograms (admin only)")
+@app_commands.default_permissions(administrator=True)
+@tracked("command")
+async def stats(interaction: discord.Interaction):
+    log_message(interaction, "🔹 Command initiated: Stats")  # ✅ Log command execution
+
+    rows = sorted(latency_stats.items(), key=lambda item: -item[1]["wall"].count)[:20]
+    lines = [f"{'name':<28}{'n':>6}{'err':>5}{'p50':>7}{'p95':>7}{'max':>7}{'io95':>7}{'ack95':>7}"]
+    for name, entry in rows:
+        wall, io, ttfr = entry["wall"], entry["io"], entry["ttfr"]
+        lines.append(
+            f"{name[:27]:<28}{wall.count:>6}{entry['errors']:>5}{wall.percentile(50):>7.0f}{wall.percentile(95):>7.0f}"
+            f"{max(wall.recent, default=0):>7.0f}{io.percentile(95):>7.0f}{ttfr.percentile(95):>7.0f}"
+        )
+
+    embed = discord.Embed(
+        title="📊 Command Latency (ms, last 1000 calls each)",
+        description="```\n" + "\n".join(lines) + "\n```" if rows else "No commands recorded yet.",
+        color=discord.Color(0x7eff00)
+    )
+    gateway = f"{loop_health['gateway_ms']:.0f} ms" if loop_health["gateway_ms"] is not None else "n/a"
+    embed.add_field(name="Event Loop", value=(
+        f"Lag p50/p95/max: {loop_health['lag'].percentile(50):.1f} / {loop_health['lag'].percentile(95):.1f} / {loop_health['max_lag_ms']:.1f} ms\n"
+        f"Stalls ≥ {SLOW_CALLBACK_MS:.0f} ms: {loop_health['stalls']}\n"
+        f"Pending tasks: {loop_health['pending_tasks']}"
+    ), inline=True)
+    embed.add_field(name="Gateway", value=f"Heartbeat latency: {gateway}", inline=True)
+    if AUTO_SHARD:
+        guilds_per_shard = defaultdict(int)
+        for guild in bot.guilds:
+            guilds_per_shard[guild.shard_id] += 1
+        shard_lines = [
+            f"{shard_id:>3}  {latency * 1000:>6.0f} ms  {guilds_per_shard[shard_id]:>6} guilds  {shard_interactions[shard_id]:>7} calls"
+            for shard_id, latency in bot.latencies[:20] if math.isfinite(latency)
+        ]
+        embed.add_field(name="Shards", value="```\n" + "\n".join(shard_lines) + "\n```" if shard_lines else "Connecting...", inline=False)
+    embed.set_footer(text="io = time in storage I/O, ack = time to first response (Discord deadline: 3000 ms)")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
 @bot.tree.command(name="set_lobby", description="Set the lobby voice channel")
 @app_commands.describe(channel="Select the voice channel to set as the lobby")
+@tracked("command")
 async def set_lobby(interaction: discord.Interaction, channel: discord.VoiceChannel):
     log_message(interaction, "🔹 Command initiated: Set Lobby")  # ✅ Log command execution
 
@@ -583,11 +1321,8 @@ async def set_lobby(interaction: discord.Interaction, channel: discord.VoiceChan
 
     guild_id = interaction.guild.id  # Get the guild ID
 
-    if guild_id not in voicesettings:
-        voicesettings[guild_id] = {}
-
-    voicesettings[guild_id]["LOBBY_CHANNEL_ID"] = channel.id
-    save_voicesettings()  # ✅ Persist settings
+    guild_voicesettings(guild_id)["LOBBY_CHANNEL_ID"] = channel.id
+    await save_voicesettings(guild_id)  # ✅ Persist settings
 
     log_message(interaction, f"✅ Lobby set to: {channel.name}")  # ✅ Log success
     await interaction.response.send_message(f"Lobby voice channel set to: **{channel.name}**", ephemeral=True)
@@ -595,6 +1330,7 @@ async def set_lobby(interaction: discord.Interaction, channel: discord.VoiceChan
 
 @bot.tree.command(name="set_category", description="Set the category for temp voice channels")
 @app_commands.describe(category="Select the category where temp voice channels will be created")
+@tracked("command")
 async def set_category(interaction: discord.Interaction, category: discord.CategoryChannel):
     log_message(interaction, "🔹 Command initiated: Set Category")  # ✅ Log command execution
 
@@ -605,11 +1341,8 @@ async def set_category(interaction: discord.Interaction, category: discord.Categ
 
     guild_id = interaction.guild.id  # Get the guild ID
 
-    if guild_id not in voicesettings:
-        voicesettings[guild_id] = {}
-
-    voicesettings[guild_id]["CATEGORY_ID"] = category.id
-    save_voicesettings()  # ✅ Persist settings
+    guild_voicesettings(guild_id)["CATEGORY_ID"] = category.id
+    await save_voicesettings(guild_id)  # ✅ Persist settings
 
     log_message(interaction, f"✅ Category set to: {category.name}")  # ✅ Log success
     await interaction.response.send_message(f"Category set to: **{category.name}**", ephemeral=True)
@@ -617,48 +1350,221 @@ async def set_category(interaction: discord.Interaction, category: discord.Categ
 
 @bot.event
 async def on_voice_state_update(member, before, after):
+    # ✅ Fast path: mute/deafen/stream/video toggles, and moves that touch neither a lobby nor a temp channel
+    before_id = before.channel.id if before.channel else None
+    after_id = after.channel.id if after.channel else None
+    if before_id == after_id:
+        return
+
+    lobby_channel_id, category_id = lobby_index.get(member.guild.id, (None, None))
+    joined_lobby = after_id is not None and after_id == lobby_channel_id
+    if not joined_lobby and before_id not in temporary_channels and after_id not in pending_deletions:
+        return
+
     guild = member.guild
-    guild_id = guild.id  # Ensure per-server settings
+    log_message("System", "🔹 Voice state update detected for %s in %s", member.display_name, guild.name, level=logging.DEBUG)  # ✅ Log user voice activity
 
-    log_message("System", f"🔹 Voice state update detected for {member.display_name} in {guild.name}")  # ✅ Log user voice activity
+    if after_id in pending_deletions:
+        pending_deletions.pop(after_id).cancel()  # ✅ Someone came back within the grace period
+        log_message("System", f"↩️ `{after.channel.name}` reoccupied by `{member.display_name}`; deletion cancelled.")
 
-    # ✅ Get per-server lobby & category IDs safely
-    lobby_channel_id = voicesettings.get(str(guild_id), {}).get("LOBBY_CHANNEL_ID", None)
-    category_id = voicesettings.get(str(guild_id), {}).get("CATEGORY_ID", None)
+    # ✅ Delete temp voice channel once it has been empty for the grace period (scheduled before the lobby join below, so a hop straight back into the lobby reuses it)
+    if before.channel and before_id in temporary_channels and before_id not in channel_pool[guild.id]:
+        temp_channel = before.channel
 
-    if not lobby_channel_id or not category_id:
-        log_message("System", f"⚠️ Missing settings for `{guild.name}`. Skipping voice event handling.")  # ✅ Log missing configuration
-        return  
+        if len(temp_channel.members) == 0:
+            if TEMP_CHANNEL_GRACE > 0:
+                if before_id not in pending_deletions:
+                    log_message("System", f"⏳ Temp voice channel `{temp_channel.name}` emptied. Deleting in {TEMP_CHANNEL_GRACE:g}s unless reused.")
+                    pending_deletions[before_id] = spawn(delete_temp_channel_later(temp_channel))
+            else:
+                await delete_temp_channel(temp_channel)
 
-    # ✅ Create temporary voice channel when user joins the lobby
-    if after.channel and after.channel.id == lobby_channel_id:
+    # ✅ Give the user a temporary voice channel when they join the lobby
+    if joined_lobby:
         category = guild.get_channel(category_id)
         if not category:
             log_message("System", f"⚠️ Category `{category_id}` not found in `{guild.name}`.")  # ✅ Log missing category
             return  
 
+        async with guild_lock(guild.id, "voice"):  # ✅ One lobby join at a time per guild; a duplicate event finds the member already moved
+            if member.voice is None or member.voice.channel is None or member.voice.channel.id != lobby_channel_id:
+                return
+            temp_channel = await claim_temp_channel(member, guild, category)
+            await member.move_to(temp_channel)
+
+
+# ✅ Fastest available channel for a lobby join: the user's own channel still in its grace period, then a pooled spare, then a new one
+async def claim_temp_channel(member, guild, category):
+    owned = [channel_id for channel_id in pending_deletions  # ✅ Only channels waiting out the grace period, usually a handful
+             if temp_channel_owners.get(channel_id) == member.id and temporary_channels[channel_id][0] == guild.id]
+    for channel_id in owned:
+        pending_deletions.pop(channel_id).cancel()
+        temp_channel = guild.get_channel(channel_id)
+        if temp_channel is None:
+            temporary_channels.pop(channel_id, None)  # ✅ Deleted by hand during the grace period
+            temp_channel_owners.pop(channel_id, None)
+            await run_io(storage.remove_temp_channels, [channel_id])
+            continue
+
+        voice_channel_stats["rejoins"] += 1
+        log_message("System", f"↩️ `{member.display_name}` rejoined the lobby; reusing their channel.")
+        return temp_channel
+
+    temp_channel = take_pooled_channel(guild, category)
+    if temp_channel:
+        # ✅ One rename per pooled channel, well inside Discord's 2-renames-per-10-minutes limit
+        await temp_channel.edit(name=f"{member.display_name}'s Lobby", sync_permissions=True, reason="Temporary voice channel for lobby.")
+        temporary_channels[temp_channel.id] = (guild.id, category.id, False)  # ✅ No longer a spare, so a restart won't pool it again
+        voice_channel_stats["pool_claims"] += 1
+        await run_io(storage.add_temp_channel, temp_channel.id, guild.id, category.id)
+        log_message("System", f"✅ Claimed pooled voice channel `{temp_channel.name}` for `{member.display_name}`.")
+    else:
         temp_channel = await guild.create_voice_channel(
             name=f"{member.display_name}'s Lobby",
             category=category,
             reason="Temporary voice channel for lobby."
         )
 
-        temporary_channels[temp_channel.id] = temp_channel
+        temporary_channels[temp_channel.id] = (guild.id, category.id, False)
+        voice_channel_stats["created"] += 1
+        await run_io(storage.add_temp_channel, temp_channel.id, guild.id, category.id)
         log_message("System", f"✅ Created temp voice channel `{temp_channel.name}` for `{member.display_name}`.")  # ✅ Log temp channel creation
 
-        await member.move_to(temp_channel)
+    temp_channel_owners[temp_channel.id] = member.id
+    if TEMP_CHANNEL_POOL_SIZE:
+        spawn(refill_channel_pool(guild))  # ✅ Top the pool back up off the join path
+    return temp_channel
+
 
-    # ✅ Delete temp voice channel if it becomes empty
-    if before.channel and before.channel.id in temporary_channels:
-        temp_channel = temporary_channels.get(before.channel.id)
+def take_pooled_channel(guild, category):
+    pool = channel_pool[guild.id]
+    while pool:
+        channel = guild.get_channel(pool.pop(0))
+        if channel is None:
+            continue
+        if channel.category_id == category.id:
+            return channel
+        spawn(delete_temp_channel(channel))  # ✅ Left over from a previous category setting
+    return None
 
-        if temp_channel and len(temp_channel.members) == 0:
-            log_message("System", f"❌ Temp voice channel `{temp_channel.name}` emptied. Deleting...")  # ✅ Log cleanup
-            await temp_channel.delete(reason="Temporary channel emptied.")
-            del temporary_channels[before.channel.id]
+
+async def refill_channel_pool(guild):
+    config = lobby_index.get(guild.id)
+    if not TEMP_CHANNEL_POOL_SIZE or not config or guild.id in pool_refills:
+        return
+    category = guild.get_channel(config[1])
+    if not category:
+        return
+
+    pool_refills.add(guild.id)
+    try:
+        while len(channel_pool[guild.id]) < TEMP_CHANNEL_POOL_SIZE:
+            channel = await guild.create_voice_channel(
+                name="Spare Lobby",
+                category=category,
+                overwrites={
+                    guild.default_role: discord.PermissionOverwrite(view_channel=False),  # ✅ Hidden until claimed
+                    guild.me: discord.PermissionOverwrite(view_channel=True, connect=True, manage_channels=True, move_members=True),
+                },
+                reason="Pre-created temporary voice channel."
+            )
+            temporary_channels[channel.id] = (guild.id, category.id, True)
+            channel_pool[guild.id].append(channel.id)
+            voice_channel_stats["created"] += 1
+            await run_io(storage.add_temp_channel, channel.id, guild.id, category.id, True)
+        log_message("System", f"🧊 Channel pool for `{guild.name}` holds {len(channel_pool[guild.id])} spare channels.")
+    except discord.HTTPException as e:
+        log_message("System", f"⚠️ Failed to refill channel pool for `{guild.name}`: {e}")
+    finally:
+        pool_refills.discard(guild.id)
+
+
+async def delete_temp_channel_later(channel):
+    await asyncio.sleep(TEMP_CHANNEL_GRACE)
+    async with guild_lock(channel.guild.id, "voice"):  # ✅ Not while a lobby join is deciding which channel to reuse
+        if pending_deletions.get(channel.id) is not asyncio.current_task():
+            return  # ✅ Cancelled by a rejoin while waiting for the lock
+        pending_deletions.pop(channel.id)
+        if not channel.members:  # ✅ Re-check: a join may have raced the timer
+            await delete_temp_channel(channel)
+
+
+async def delete_temp_channel(channel):
+    log_message("System", f"❌ Deleting temp voice channel `{channel.name}`...")  # ✅ Log cleanup
+    try:
+        await channel.delete(reason="Temporary channel emptied.")
+    except discord.NotFound:
+        pass  # ✅ Already deleted by hand
+    except discord.HTTPException as e:
+        log_message("System", f"⚠️ Failed to delete temp voice channel `{channel.name}`: {e}")
+        return
+
+    temporary_channels.pop(channel.id, None)
+    temp_channel_owners.pop(channel.id, None)
+    voice_channel_stats["deleted"] += 1
+    await run_io(storage.remove_temp_channels, [channel.id])
+
+
+# ✅ Startup pass over the persisted registry: adopt occupied temp channels, re-pool surviving spares,
+# delete empty ones, forget vanished ones
+async def reconcile_temp_channels(guild_ids):
+    by_category = defaultdict(list)
+    for channel_id, (guild_id, category_id, spare) in temporary_channels.items():
+        if guild_id in guild_ids:
+            by_category[(guild_id, category_id)].append((channel_id, spare))
+
+    forgotten, to_delete, adopted, pooled = [], [], 0, 0
+    for (guild_id, category_id), channel_ids in by_category.items():
+        guild = bot.get_guild(guild_id)
+        if guild is None:
+            continue  # ✅ Guild unavailable right now; keep tracking and retry on the next start
+
+        config = lobby_index.get(guild_id)
+        pool = channel_pool[guild_id]
+        for channel_id, spare in channel_ids:  # ✅ Cache lookups per tracked ID, never a scan of the guild's channels
+            channel = guild.get_channel(channel_id)
+            if channel is None:
+                forgotten.append(channel_id)  # ✅ Deleted by hand while the bot was down
+            elif channel_id in pool:
+                continue  # ✅ Already pooled by an earlier pass
+            elif (spare and not channel.members and config and channel.category_id == config[1]
+                  and len(pool) < TEMP_CHANNEL_POOL_SIZE):
+                pool.append(channel_id)  # ✅ Still a valid spare: keep it instead of deleting and re-creating it
+                pooled += 1
+            elif not channel.members:
+                to_delete.append(channel)
+            else:
+                adopted += 1
+
+    delete_slots = asyncio.Semaphore(TEMP_CHANNEL_DELETE_CONCURRENCY)
+
+    async def delete_channel(channel):
+        async with delete_slots:
+            try:
+                await channel.delete(reason="Temporary channel left empty across a restart.")
+                return channel.id
+            except discord.NotFound:
+                return channel.id  # ✅ Already gone
+            except discord.HTTPException as e:
+                log_message("System", f"⚠️ Failed to delete stale temp channel `{channel.name}`: {e}")
+                return None
+
+    deleted = [channel_id for channel_id in await asyncio.gather(*(delete_channel(channel) for channel in to_delete)) if channel_id]
+    voice_channel_stats["deleted"] += len(deleted)
+
+    removed = forgotten + deleted
+    for channel_id in removed:
+        del temporary_channels[channel_id]
+    if removed:
+        await run_io(storage.remove_temp_channels, removed)  # ✅ One registry write for the whole pass
+
+    log_message("System", f"🧹 Temp channels reconciled: {adopted} adopted, {pooled} pooled, {len(deleted)} deleted, {len(forgotten)} already gone "
+                          f"({len(by_category)} categories)")
 
 # """
 @bot.tree.command(name="join", description="Bot joins your voice channel")
+@tracked("command")
 async def join(interaction: discord.Interaction):
     log_message(interaction, "🔹 Command initiated: Join")  # ✅ Log command execution
 
@@ -685,6 +1591,7 @@ async def join(interaction: discord.Interaction):
 
 
 @bot.tree.command(name="leave", description="Bot leaves the voice channel")
+@tracked("command")
 async def leave(interaction: discord.Interaction):
     log_message(interaction, "🔹 Command initiated: Leave")  # ✅ Log command execution
 
@@ -705,6 +1612,27 @@ async def leave(interaction: discord.Interaction):
 # """    
 
 
+# ✅ Moves members concurrently; discord.py queues each request behind its route's rate-limit bucket
+async def bulk_move_members(members, target_channel):
+    move_slots = asyncio.Semaphore(MOVE_CONCURRENCY)
+
+    async def move_one(member):
+        if not member.voice or not member.voice.channel:
+            return member, "not in a voice channel"
+        if member.voice.channel.id == target_channel.id:
+            return member, None  # ✅ Already there
+
+        async with move_slots:
+            try:
+                await member.move_to(target_channel)
+                return member, None
+            except discord.HTTPException as e:
+                log_message("System", f"⚠️ Move failed for {member.display_name}: {e}")  # ✅ Log failure
+                return member, e.text or str(e)
+
+    return await asyncio.gather(*(move_one(member) for member in members))
+
+
 # View for handling dropdown
 class MemberSelectView(discord.ui.View):
     def __init__(self, guild, target_channel, command_user_id):
@@ -735,6 +1663,7 @@ class MemberSelectDropdown(discord.ui.Select):
         self.selected_members = []
         self.target_channel = target_channel  # ✅ Store target channel
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, f"✅ Members selected: {[m.display_name for m in self.selected_members]}")  # ✅ Log selections
 
@@ -746,6 +1675,7 @@ class CancelMoveButton(discord.ui.Button):
         super().__init__(label="Cancel Move", style=discord.ButtonStyle.danger)
         self.command_user_id = command_user_id
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         if interaction.user.id != self.command_user_id:
             log_message(interaction, "⚠️ Unauthorized cancel attempt blocked")  # ✅ Log unauthorized access
@@ -766,6 +1696,7 @@ class ConfirmMoveButton(discord.ui.Button):
         self.moved_members = moved_members
         self.target_channel = target_channel  # ✅ Ensures it's never None
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, "🔹 Button clicked: Confirm Move")  # ✅ Log button press
 
@@ -788,21 +1719,26 @@ class ConfirmMoveButton(discord.ui.Button):
         log_message(interaction, f"✅ Moving selected members to {self.target_channel.name}")  # ✅ Log move initiation
 
         selected_members = self.moved_members if self.moved_members else (self.dropdown.selected_members if self.dropdown else [])
+        selected_members = [member for member in selected_members if member is not None]  # ✅ Members who left the server
         if not selected_members:
             log_message(interaction, "⚠️ Move failed: No members selected")  # ✅ Log error
             await interaction.response.send_message("⚠️ No members selected!", ephemeral=True)
             return
 
-        for member in selected_members:
-            try:
-                await member.move_to(self.target_channel)
-                log_message(interaction, f"✅ Successfully moved {member.display_name}")  # ✅ Log each successful move
-            except discord.HTTPException:
-                log_message(interaction, f"⚠️ Move failed for {member.display_name}")  # ✅ Log failure
-                await interaction.response.send_message(f"⚠️ Failed to move `{member.display_name}`!", ephemeral=True)
+        await interaction.response.defer(ephemeral=True, thinking=True)  # ✅ Acknowledge now; large groups can take a while
+
+        results = await bulk_move_members(selected_members, self.target_channel)
+        moved = [member for member, error in results if error is None]
+        failed = [(member, error) for member, error in results if error is not None]
+
+        log_message(interaction, f"🎯 Move completed: {len(moved)} moved, {len(failed)} failed, target {self.target_channel.name}")  # ✅ Log move completion
 
-        log_message(interaction, f"🎯 Move completed: {len(selected_members)} members moved to {self.target_channel.name}")  # ✅ Log move completion
-        await interaction.response.send_message(f"✅ Moved {len(selected_members)} members to `{self.target_channel.name}`.", ephemeral=True)
+        summary = f"✅ Moved {len(moved)} members to `{self.target_channel.name}`."
+        if failed:
+            failed_lines = "\n".join(f"• `{member.display_name}`: {error}" for member, error in failed[:20])
+            more = f"\n…and {len(failed) - 20} more." if len(failed) > 20 else ""
+            summary += f"\n⚠️ Failed to move {len(failed)}:\n{failed_lines}{more}"
+        await interaction.followup.send(summary, ephemeral=True)
 
         self.disabled = True
         if interaction.message:
@@ -814,6 +1750,7 @@ class ConfirmMoveButton(discord.ui.Button):
 
 @bot.tree.command(name="move", description="Move selected users to another voice channel")
 @app_commands.describe(channel="Voice channel to move members to")
+@tracked("command")
 async def move(interaction: discord.Interaction, channel: discord.VoiceChannel):
     log_message(interaction, "🔹 Command initiated")  # ✅ Log the start of execution
 
@@ -832,6 +1769,7 @@ async def move(interaction: discord.Interaction, channel: discord.VoiceChannel):
 
 @bot.tree.command(name="moveall", description="Move all users from one voice channel to another")
 @app_commands.describe(source_channel="Source voice channel", target_channel="Destination voice channel")
+@tracked("command")
 async def moveall(interaction: discord.Interaction, source_channel: discord.VoiceChannel, target_channel: discord.VoiceChannel):
     log_message(interaction, "🔹 Command initiated")  # ✅ Log start of command execution
     
@@ -847,12 +1785,13 @@ async def moveall(interaction: discord.Interaction, source_channel: discord.Voic
     
     log_message(interaction, f"✅ Moving members from {source_channel.name} to {target_channel.name}")  # ✅ Log action
 
-    moved_members = source_channel.members  # ✅ Store bulk move members
+    moved_members = list(source_channel.members)  # ✅ Store bulk move members
     view = discord.ui.View()
     confirm_button = ConfirmMoveButton(
         command_user_id=interaction.user.id, 
         parent_view=view, 
         dropdown=None, 
+        moved_members=moved_members,
         target_channel=target_channel  # ✅ Ensure it's passed correctly
     )
     view.add_item(confirm_button)  # ✅ Now works with a unique `custom_id`
@@ -867,14 +1806,9 @@ async def moveall(interaction: discord.Interaction, source_channel: discord.Voic
     )
 
                   
-# ✅ Split data into pages (10 items per page)
-def paginate_data(data, items_per_page=10):
-    log_message("System", f"🔄 Paginating data ({len(data)} items, {items_per_page} per page)")
-    return [data[i:i + items_per_page] for i in range(0, len(data), items_per_page)]
-
 # ✅ Create Embed for a specific page
 def create_embed(data, page, total_pages, total_bones):
-    log_message("System", f"📜 Generating embed for Page {page+1}/{total_pages} (Total: {total_bones} bones)")
+    log_message("System", "📜 Generating embed for Page %d/%d (Total: %d bones)", page + 1, total_pages, total_bones, level=logging.DEBUG)
     
     embed = discord.Embed(
         title=f"**__Bones List__** (Total: {total_bones} bones) [Page {page+1}/{total_pages}]",
@@ -887,28 +1821,55 @@ def create_embed(data, page, total_pages, total_bones):
 
     return embed
 
-# ✅ View for pagination buttons
+# ✅ Rendered leaderboard pages per guild, valid for one leaderboard version; any bones change drops the guild's pages
+class RenderedPageCache:
+    def __init__(self):
+        self.guilds = {}  # ✅ guild_id -> (version, {(mode, page): embed})
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, guild_id, leaderboard, mode, page):
+        version, pages = self.guilds.get(guild_id, (None, None))
+        if version != leaderboard.version:
+            pages = {}
+            self.guilds[guild_id] = (leaderboard.version, pages)
+
+        embed = pages.get((mode, page))
+        if embed is not None:
+            self.hits += 1
+            return embed
+
+        self.misses += 1
+        embed = create_embed(leaderboard.page(mode, page, 10), page, leaderboard.page_count(10), leaderboard.total)
+        pages[(mode, page)] = embed  # ✅ Shared between viewers; embeds are only serialized, never mutated, when sent
+        return embed
+
+
+rendered_pages = RenderedPageCache()
+
+
+# ✅ View for pagination buttons (reads pages straight from the guild's live leaderboard)
 class PaginationView(discord.ui.View):
-    def __init__(self, data, guild_id):
+    def __init__(self, leaderboard, guild_id):
         log_message("System", f"🔹 Initializing PaginationView for `{guild_id}`")
         super().__init__()
 
-        guild_data = data.get(str(guild_id), {})
-        if not isinstance(guild_data, dict):  
-            log_message("System", f"⚠️ ERROR: Invalid `guild_data` for `{guild_id}`! Initializing empty.")
-            guild_data = {}
-
-        data_list = [{"name": key, "count": value.get("count", 0)} for key, value in guild_data.items()]
-        self.total_bones = sum(item["count"] for item in data_list)
-
-        sorted_data = sorted(data_list, key=lambda x: (-x["count"], x["name"].lower()))
-        self.data_pages = paginate_data(sorted_data, 10)
+        self.guild_id = str(guild_id)
+        self.leaderboard = leaderboard
         self.current_page = 0
         self.sorting_mode = "count"
 
         self.add_buttons()
         self.update_buttons()
 
+    @property
+    def total_pages(self):
+        return self.leaderboard.page_count(10)
+
+    def current_embed(self):
+        self.current_page = min(self.current_page, self.total_pages - 1)  # ✅ Names may have been removed since the last click
+        return rendered_pages.get(self.guild_id, self.leaderboard, self.sorting_mode, self.current_page)
+
     def add_buttons(self):    
         self.previous_button = discord.ui.Button(label="⬅️", style=discord.ButtonStyle.primary, custom_id="prev_page")
         self.next_button = discord.ui.Button(label="➡️", style=discord.ButtonStyle.primary, custom_id="next_page")
@@ -925,50 +1886,49 @@ class PaginationView(discord.ui.View):
         self.add_item(self.sort_desc)
         self.add_item(self.next_button)
 
+    @tracked("component")
     async def previous_page(self, interaction: discord.Interaction):
         log_message(interaction, f"⬅️ User requested previous page ({self.current_page})")
         if self.current_page > 0:
             self.current_page -= 1
         await self.update_view(interaction)
 
+    @tracked("component")
     async def next_page(self, interaction: discord.Interaction):
         log_message(interaction, f"➡️ User requested next page ({self.current_page})")
-        if self.current_page < len(self.data_pages) - 1:
+        if self.current_page < self.total_pages - 1:
             self.current_page += 1
         await self.update_view(interaction)
 
+    @tracked("component")
     async def sort_by_alpha(self, interaction: discord.Interaction):
         log_message(interaction, "🔤 Sorting by name (A-Z)")
         self.sorting_mode = "alpha"
-        sorted_data = sorted(sum(self.data_pages, []), key=lambda x: x["name"].lower())
-        self.data_pages = paginate_data(sorted_data, 10)
         self.current_page = 0  
         await self.update_view(interaction)
 
+    @tracked("component")
     async def sort_by_count(self, interaction: discord.Interaction):
         log_message(interaction, "🔢 Sorting by count (highest first)")
         self.sorting_mode = "count"
-        sorted_data = sorted(sum(self.data_pages, []), key=lambda x: -x["count"])
-        self.data_pages = paginate_data(sorted_data, 10)
         self.current_page = 0  
         await self.update_view(interaction)
 
     async def update_view(self, interaction: discord.Interaction):
         log_message(interaction, f"🔄 Updating view to Page {self.current_page+1}")
+        embed = self.current_embed()
         self.update_buttons()
-        await interaction.response.edit_message(
-            embed=create_embed(self.data_pages[self.current_page], self.current_page, len(self.data_pages), self.total_bones),
-            view=self
-        )
+        await interaction.response.edit_message(embed=embed, view=self)
 
     def update_buttons(self):
         self.previous_button.disabled = self.current_page == 0
-        self.next_button.disabled = self.current_page >= len(self.data_pages) - 1
+        self.next_button.disabled = self.current_page >= self.total_pages - 1
         self.sort_alpha.disabled = self.sorting_mode == "alpha"
         self.sort_desc.disabled = self.sorting_mode == "count"
 
 
 @bot.tree.command(name="showbones", description="Show Bone list")
+@tracked("command")
 async def showbones(interaction: discord.Interaction):
     log_message(interaction, "🔹 Command initiated: `showbones`")
     
@@ -978,23 +1938,21 @@ async def showbones(interaction: discord.Interaction):
         return
     
     guild_id = str(interaction.guild.id)  
-    data = load_json()
+    leaderboard = bones_store.leaderboard(guild_id)
 
-    if not isinstance(data, dict) or guild_id not in data or not isinstance(data[guild_id], dict):
+    if not leaderboard:
         log_message(interaction, f"⚠️ No valid bone data found for `{interaction.guild.name}`")
         await interaction.response.send_message(f"⚠️ No valid bone data found for `{interaction.guild.name}`!", ephemeral=True)
         return
 
-    view = PaginationView(data, guild_id)  
+    view = PaginationView(leaderboard, guild_id)  
     log_message(interaction, f"✅ Sending Page 1 of `{guild_id}`'s bones list.")
     
-    await interaction.response.send_message(
-        embed=create_embed(view.data_pages[0], 0, len(view.data_pages), view.total_bones),
-        view=view
-    )
+    await interaction.response.send_message(embed=view.current_embed(), view=view)
 
 
 @bot.tree.command(name="addname", description="Add a name to the Bones List")
+@tracked("command")
 async def addname(interaction: discord.Interaction, name: str):
     log_message(interaction, "🔹 Command initiated: `addname`")  # ✅ Log command execution
     
@@ -1029,33 +1987,70 @@ async def addname(interaction: discord.Interaction, name: str):
 
     title_case_name = name.title()
 
-    if guild_id not in data:
-        data[guild_id] = {}
+    previous_count, new_count = await update_bone(bones_store, guild_id, title_case_name, lambda count: 1 if count is None else count)
 
-    if title_case_name in data[guild_id]:
+    if previous_count is not None:
         log_message(interaction, f"⚠️ Duplicate name `{title_case_name}` found in `{interaction.guild.name}`")  # ✅ Log duplicate detection
         embed = discord.Embed(title="⚠️ Duplicate Name", description=f"`{title_case_name}` is already in the list for `{interaction.guild.name}`.", color=discord.Color.red())
     else:
         log_message(interaction, f"✅ Adding `{title_case_name}` to `{interaction.guild.name}`")  # ✅ Log successful addition
-        data[guild_id][title_case_name] = {"count": 1}
-        save_json(guild_id, title_case_name, {"count": 1})  
-
-        updated_data = load_json()
-        embed = discord.Embed(title="✅ Name Added", description=f"`{title_case_name}` has been added to `{interaction.guild.name}` with count `{updated_data[guild_id][title_case_name]['count']}`!", color=discord.Color(0x7eff00))
+        embed = discord.Embed(title="✅ Name Added", description=f"`{title_case_name}` has been added to `{interaction.guild.name}` with count `{new_count}`!", color=discord.Color(0x7eff00))
 
     await interaction.response.send_message(embed=embed)
 
 
+NAMES_PER_SELECT = 25  # ✅ Discord's limit on options in one select menu
+
+
+# ✅ Suggests up to 25 names from the guild's leaderboard as the user types
+@tracked("autocomplete")
+async def bone_name_autocomplete(interaction: discord.Interaction, current: str):
+    leaderboard = bones_store.leaderboard(interaction.guild_id) if interaction.guild_id else None
+    if not leaderboard:
+        return []
+    return [app_commands.Choice(name=name[:100], value=name) for name in leaderboard.search(current, NAMES_PER_SELECT)]
+
+
+# ✅ Previous/next buttons for name selects longer than 25 options; `make_view(page)` rebuilds the view for that page
+class NamePageButton(discord.ui.Button):
+    def __init__(self, label, leaderboard, page, make_view, disabled):
+        super().__init__(label=label, style=discord.ButtonStyle.secondary, disabled=disabled, row=1)
+        self.leaderboard = leaderboard
+        self.page = page
+        self.make_view = make_view
+
+    @tracked("component")
+    async def callback(self, interaction: discord.Interaction):
+        if not self.leaderboard:  # ✅ Every name was removed since the pager was sent; a Select needs at least one option
+            log_message(interaction, "⚠️ No names left to page through")
+            await interaction.response.edit_message(content="⚠️ No valid bone data found!", view=None)
+            return
+
+        page = min(self.page, self.leaderboard.page_count(NAMES_PER_SELECT) - 1)  # ✅ Names may have been removed since the last click
+        log_message(interaction, f"📄 Showing names page {page + 1}")
+        await interaction.response.edit_message(view=self.make_view(page))
+
+
+def add_name_pager(view, leaderboard, page, make_view):
+    total_pages = leaderboard.page_count(NAMES_PER_SELECT)
+    if total_pages > 1:
+        view.add_item(NamePageButton("⬅️", leaderboard, page - 1, make_view, disabled=page == 0))
+        view.add_item(NamePageButton(f"➡️ ({page + 1}/{total_pages})", leaderboard, page + 1, make_view, disabled=page >= total_pages - 1))
+
+
+def bone_added_embed(name, count):
+    return discord.Embed(
+        title="🦴 Bone Added!", 
+        description=f"`{name}` now has `{count}` bones!", 
+        color=discord.Color(0x7eff00)
+    )
+
+
 class BoneDropdown(discord.ui.Select):
     def __init__(self, guild_id, names):
         log_message("System", f"🔹 Initializing BoneDropdown for `{guild_id}`")
         try:
-            if not isinstance(names, dict):
-                log_message("System", f"⚠️ ERROR: Expected dictionary for `{guild_id}`, got `{type(names)}`")
-                names = {}
-
-            sorted_names = sorted(names.keys())
-            options = [discord.SelectOption(label=name, value=name) for name in sorted_names]
+            options = [discord.SelectOption(label=name, value=name) for name in names]
 
             if not options:
                 log_message("System", f"⚠️ ERROR: Dropdown options were empty for `{guild_id}`")
@@ -1065,43 +2060,32 @@ class BoneDropdown(discord.ui.Select):
         except Exception as e:
             log_message("System", f"⚠️ ERROR in BoneDropdown for `{guild_id}`: {e}")
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         guild_id = str(interaction.guild.id)
         selected_name = self.values[0]
         log_message(interaction, f"🦴 User selected `{selected_name}` for `{guild_id}`")  # ✅ Log selection
 
-        data = load_json()
-
-        if guild_id not in data:
-            data[guild_id] = {}
-
-        if selected_name in data[guild_id]:
-            data[guild_id][selected_name]["count"] += 1  # ✅ Increment count
-        else:
-            data[guild_id][selected_name] = {"count": 1}  # ✅ First-time entry
-
-        save_json(guild_id, selected_name, data[guild_id][selected_name])  
-
-        embed = discord.Embed(
-            title="🦴 Bone Added!", 
-            description=f"`{selected_name}` now has `{data[guild_id][selected_name]['count']}` bones!", 
-            color=discord.Color(0x7eff00)
-        )
+        _, new_count = await update_bone(bones_store, guild_id, selected_name, lambda count: count + 1 if count else 1)  # ✅ Increment count (or first-time entry)
 
         log_message(interaction, f"✅ `{selected_name}` bone count updated for `{guild_id}`")
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.response.edit_message(embed=bone_added_embed(selected_name, new_count), view=None)
 
 
 class BoneView(discord.ui.View):
-    def __init__(self, guild_id, names):
+    def __init__(self, guild_id, leaderboard, page=0):
         log_message("System", f"🔹 Initializing BoneView for `{guild_id}`")  # ✅ Log View creation
         super().__init__()
-        self.add_item(BoneDropdown(guild_id, names))
+        self.add_item(BoneDropdown(guild_id, leaderboard.names_page(page, NAMES_PER_SELECT)))
         self.add_item(CancelButton())  # ✅ Include Cancel button
+        add_name_pager(self, leaderboard, page, lambda new_page: BoneView(guild_id, leaderboard, new_page))
 
 
 @bot.tree.command(name="bone", description="Add +1 bone to a name's count")
-async def bone(interaction: discord.Interaction):
+@app_commands.describe(name="Start typing to pick a name (leave empty for the menu)")
+@app_commands.autocomplete(name=bone_name_autocomplete)
+@tracked("command")
+async def bone(interaction: discord.Interaction, name: str = None):
     log_message(interaction, "🔹 Command initiated: `bone`")  # ✅ Log command execution
 
     if not interaction.guild:
@@ -1117,18 +2101,43 @@ async def bone(interaction: discord.Interaction):
         await interaction.response.send_message(f"⚠️ No valid bone data found for `{interaction.guild.name}`!", ephemeral=True)
         return
 
-    view = BoneView(guild_id, data[guild_id])  
+    if name is not None:
+        _, new_count = await update_bone(bones_store, guild_id, name, lambda count: count + 1 if count is not None else None)
+        if new_count is None:
+            log_message(interaction, f"⚠️ `{name}` not found in `{guild_id}`")
+            await interaction.response.send_message(f"⚠️ `{name}` is not on the list. Use `/addname` first.", ephemeral=True)
+            return
+
+        log_message(interaction, f"✅ `{name}` bone count updated for `{guild_id}`")
+        await interaction.response.send_message(embed=bone_added_embed(name, new_count), ephemeral=True)
+        return
+
+    view = BoneView(guild_id, bones_store.leaderboard(guild_id))  
     log_message(interaction, f"✅ Sending Bone selection menu for `{guild_id}`")
     
     await interaction.response.send_message("Select a name to add a bone:", view=view, ephemeral=True)
 
 
 class RemoveNameView(discord.ui.View):
-    def __init__(self, guild_id, names):
+    def __init__(self, guild_id, leaderboard, page=0):
         log_message("System", f"🔹 Initializing RemoveNameView for `{guild_id}`")  # ✅ Log initialization
         super().__init__()
-        self.add_item(RemoveDropdown(guild_id, names))
+        self.add_item(RemoveDropdown(guild_id, leaderboard.names_page(page, NAMES_PER_SELECT)))
         self.add_item(CancelButton())  # ✅ Include Cancel button
+        add_name_pager(self, leaderboard, page, lambda new_page: RemoveNameView(guild_id, leaderboard, new_page))
+
+
+def removal_confirmation(guild_id, selected_name):
+    embed = discord.Embed(
+        title="⚠️ Confirm Removal",
+        description=f"Are you sure you want to remove `{selected_name}`?",
+        color=discord.Color.orange(),
+    )
+
+    confirmation_view = discord.ui.View()
+    confirmation_view.add_item(ConfirmButton(guild_id, selected_name))  
+    confirmation_view.add_item(UndoButton(selected_name))  
+    return embed, confirmation_view
 
 class RemoveDropdown(discord.ui.Select):
     def __init__(self, guild_id, names):
@@ -1142,55 +2151,50 @@ class RemoveDropdown(discord.ui.Select):
         super().__init__(placeholder="Select a name to remove", min_values=1, max_values=1, options=options, disabled=False)
         self.selected_name = None  
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         self.selected_name = self.values[0]  
 
         log_message(interaction, f"⚠️ User selected `{self.selected_name}` for removal in `{self.guild_id}`")  # ✅ Log selection
 
-        embed = discord.Embed(
-            title="⚠️ Confirm Removal",
-            description=f"Are you sure you want to remove `{self.selected_name}`?",
-            color=discord.Color.orange(),
-        )
-
-        confirmation_view = discord.ui.View()
-        confirmation_view.add_item(ConfirmButton(self.guild_id, self))  
-        confirmation_view.add_item(UndoButton(self))  
-
+        embed, confirmation_view = removal_confirmation(self.guild_id, self.selected_name)
         await interaction.response.edit_message(embed=embed, view=confirmation_view)
 
 class CancelButton(discord.ui.Button):
     def __init__(self):
         super().__init__(label="Cancel", style=discord.ButtonStyle.secondary)
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, "❌ User cancelled removal process.")  # ✅ Log cancellation
         embed = discord.Embed(title="❌ Action Cancelled", description="No name was removed.", color=discord.Color(0x7eff00))
         await interaction.response.edit_message(embed=embed, view=None)  
 
 class UndoButton(discord.ui.Button):
-    def __init__(self, dropdown: RemoveDropdown):
+    def __init__(self, selected_name):
         super().__init__(label="Undo Removal", style=discord.ButtonStyle.secondary)
-        self.dropdown = dropdown  
+        self.selected_name = selected_name  
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
-        log_message(interaction, f"❌ User undid removal of `{self.dropdown.selected_name}`")  # ✅ Log undo action
-        embed = discord.Embed(title="❌ Action Cancelled", description=f"`{self.dropdown.selected_name}` was **not** removed.", color=discord.Color(0x7eff00))
+        log_message(interaction, f"❌ User undid removal of `{self.selected_name}`")  # ✅ Log undo action
+        embed = discord.Embed(title="❌ Action Cancelled", description=f"`{self.selected_name}` was **not** removed.", color=discord.Color(0x7eff00))
         await interaction.response.edit_message(embed=embed, view=None)  
 
 class ConfirmButton(discord.ui.Button):
-    def __init__(self, guild_id, dropdown: RemoveDropdown):
+    def __init__(self, guild_id, selected_name):
         super().__init__(label="Confirm Removal", style=discord.ButtonStyle.danger)
         self.guild_id = str(guild_id)
-        self.dropdown = dropdown  
+        self.selected_name = selected_name  
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
-        selected_name = self.dropdown.selected_name
+        selected_name = self.selected_name
         log_message(interaction, f"⚠️ User confirmed removal of `{selected_name}` in `{self.guild_id}`")  # ✅ Log confirmation
 
-        data = load_json()
+        previous_count, _ = await update_bone(bones_store, self.guild_id, selected_name, lambda count: None)  # ✅ Removes the name (and the guild entry if it was the last one)
 
-        if self.guild_id not in data or selected_name not in data[self.guild_id]:
+        if previous_count is None:
             log_message(interaction, f"⚠️ Name `{selected_name}` not found in `{interaction.guild.name}`")  # ✅ Log failure case
             embed = discord.Embed(
                 title="⚠️ Name Not Found",
@@ -1198,14 +2202,6 @@ class ConfirmButton(discord.ui.Button):
                 color=discord.Color.orange(),
             )
         else:
-            del data[self.guild_id][selected_name]  
-
-            if not data[self.guild_id]:  
-                del data[self.guild_id]
-                log_message(interaction, f"🗑 Removed empty guild entry for `{interaction.guild.name}`")
-
-            save_json(data)  
-
             log_message(interaction, f"✅ `{selected_name}` successfully removed from `{interaction.guild.name}`!")  # ✅ Log successful removal
             embed = discord.Embed(
                 title="✅ Name Removed",
@@ -1216,7 +2212,10 @@ class ConfirmButton(discord.ui.Button):
         await interaction.response.edit_message(embed=embed, view=None)  
 
 @bot.tree.command(name="removename", description="Remove a name from the list")
-async def removename(interaction: discord.Interaction):
+@app_commands.describe(name="Start typing to pick a name (leave empty for the menu)")
+@app_commands.autocomplete(name=bone_name_autocomplete)
+@tracked("command")
+async def removename(interaction: discord.Interaction, name: str = None):
     log_message(interaction, "🔹 Command initiated: `removename`")  # ✅ Log command execution
     
     if not interaction.guild:  
@@ -1232,54 +2231,61 @@ async def removename(interaction: discord.Interaction):
         await interaction.response.send_message(f"⚠️ The list is empty for `{interaction.guild.name}`!", ephemeral=True)
         return
 
-    name_list = list(data[guild_id].keys())
+    if name is not None:
+        if name not in data[guild_id]:
+            log_message(interaction, f"⚠️ `{name}` not found in `{guild_id}`")
+            await interaction.response.send_message(f"⚠️ `{name}` is not on the list.", ephemeral=True)
+            return
+
+        embed, confirmation_view = removal_confirmation(guild_id, name)
+        await interaction.response.send_message(embed=embed, view=confirmation_view, ephemeral=True)
+        return
 
     log_message(interaction, f"✅ Showing removal menu for `{guild_id}`")  # ✅ Log menu display
-    view = RemoveNameView(guild_id, name_list[::-1])  
+    view = RemoveNameView(guild_id, bones_store.leaderboard(guild_id))  
     await interaction.response.send_message("Select a name to remove:", view=view, ephemeral=True)
 
 
 # Buttons for Adjusting Count
 class AdjustCountView(discord.ui.View):
-    def __init__(self, guild_id, names, data):
+    def __init__(self, guild_id, leaderboard, page=0):
         log_message("System", f"🔹 Initializing AdjustCountView for `{guild_id}`")  
         super().__init__()
         self.guild_id = str(guild_id)
-        self.data = data  # ✅ Store bones.json data once
 
-        reversed_names = list(reversed(names))
-        self.add_item(CountDropdown(self.guild_id, reversed_names, self.data))  
+        self.add_item(CountDropdown(self.guild_id, leaderboard.names_page(page, NAMES_PER_SELECT)))  
         self.add_item(CancelButton())
+        add_name_pager(self, leaderboard, page, lambda new_page: AdjustCountView(self.guild_id, leaderboard, new_page))
 
 class AdjustButtonView(discord.ui.View):
-    def __init__(self, guild_id, entry, data):
+    def __init__(self, guild_id, entry):
         log_message("System", f"🔹 Initializing AdjustButtonView for `{guild_id}` and `{entry['name']}`")  
         super().__init__()
         self.guild_id = str(guild_id)
         self.entry = entry
-        self.data = data  # ✅ Store JSON data once and reuse it
 
-        self.add_item(IncreaseCountButton(self.guild_id, self.entry, self.data))
-        self.add_item(DecreaseCountButton(self.guild_id, self.entry, self.data))  
-        self.add_item(SaveButton(self.guild_id, self.entry, self.data)) 
+        self.add_item(IncreaseCountButton(self.guild_id, self.entry))
+        self.add_item(DecreaseCountButton(self.guild_id, self.entry))  
+        self.add_item(SaveButton(self.guild_id, self.entry)) 
 
 class SaveButton(discord.ui.Button):
-    def __init__(self, guild_id, entry, data):
+    def __init__(self, guild_id, entry):
         super().__init__(label="💾 Save", style=discord.ButtonStyle.primary)
         self.guild_id = str(guild_id)
         self.entry = entry
-        self.data = data  # ✅ Store already-loaded data instead of reloading
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, f"✅ Saving `{self.entry['name']}` count in `{self.guild_id}`")
 
-        if self.guild_id not in self.data or self.entry["name"] not in self.data[self.guild_id]:
+        current = load_json().get(self.guild_id, {}).get(self.entry["name"])
+        if current is None:
             log_message(interaction, f"⚠️ Save failed: `{self.entry['name']}` not found in `{self.guild_id}`")  
             await interaction.response.send_message("⚠️ Name not found in this server's list.", ephemeral=True)
             return
 
-        updated_count = self.entry["count"]
-        save_json(self.guild_id, self.entry["name"], {"count": updated_count})  # ✅ Save without reloading json
+        # ✅ Every +/- click is already persisted; writing `self.entry` back here would overwrite newer changes
+        updated_count = current["count"]
 
         log_message(interaction, f"✅ `{self.entry['name']}` count updated to `{updated_count}` in `{self.guild_id}`")  
         embed = discord.Embed(
@@ -1293,95 +2299,97 @@ class CancelButton(discord.ui.Button):
     def __init__(self):
         super().__init__(label="Cancel", style=discord.ButtonStyle.secondary)
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, "❌ User cancelled count adjustment.")  # ✅ Log cancel action
         embed = discord.Embed(title="❌ Action Cancelled", description="No changes were made.", color=discord.Color.blue())
         await interaction.response.edit_message(embed=embed, view=None)
 
 class IncreaseCountButton(discord.ui.Button):
-    def __init__(self, guild_id, entry, data):
+    def __init__(self, guild_id, entry):
         super().__init__(label="➕ Increase Count", style=discord.ButtonStyle.green)
         self.guild_id = str(guild_id)
         self.entry = entry
-        self.data = data  # ✅ Use the passed data instead of calling `load_json()`
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, f"✅ Increasing count for `{self.entry['name']}` in `{self.guild_id}`")  
 
-        if self.entry["name"] in self.data.get(self.guild_id, {}):
-            self.data[self.guild_id][self.entry["name"]]["count"] += 1
-            save_json(self.guild_id, self.entry["name"], self.data[self.guild_id][self.entry["name"]])
-            updated_count = self.data[self.guild_id][self.entry["name"]]["count"]
+        _, updated_count = await update_bone(bones_store, self.guild_id, self.entry["name"], lambda count: count + 1 if count is not None else None)
+        if updated_count is None:
+            log_message(interaction, f"⚠️ Increase failed: `{self.entry['name']}` not found in `{self.guild_id}`")  
+            await interaction.response.send_message("⚠️ Name not found in this server's list.", ephemeral=True)
+            return
 
         embed = discord.Embed(title=f"Adjust Count for `{self.entry['name']}`",
                             description=f"Current count: `{updated_count}`",
                             color=discord.Color.green())
 
-        new_view = AdjustButtonView(self.guild_id, {"name": self.entry["name"], "count": updated_count}, self.data)  
+        new_view = AdjustButtonView(self.guild_id, {"name": self.entry["name"], "count": updated_count})  
         await interaction.response.edit_message(embed=embed, view=new_view)
 
 class DecreaseCountButton(discord.ui.Button):
-    def __init__(self, guild_id, entry, data):
+    def __init__(self, guild_id, entry):
         super().__init__(label="➖ Decrease Count", style=discord.ButtonStyle.red)
         self.guild_id = str(guild_id)
         self.entry = entry
-        self.data = data  # ✅ Use the passed data instead of calling `load_json()`
 
+    @tracked("component")
     async def callback(self, interaction: discord.Interaction):
         log_message(interaction, f"✅ Decreasing count for `{self.entry['name']}` in `{self.guild_id}`")  
 
-        if self.guild_id not in self.data or self.entry["name"] not in self.data[self.guild_id]:
+        previous_count, updated_count = await update_bone(
+            bones_store, self.guild_id, self.entry["name"], lambda count: count - 1 if count is not None and count > 1 else count
+        )
+
+        if previous_count is None:
             log_message(interaction, f"⚠️ Decrease failed: `{self.entry['name']}` not found in `{self.guild_id}`")  
             await interaction.response.send_message("⚠️ Name not found in this server's list.", ephemeral=True)
             return
 
-        updated_count = self.data[self.guild_id][self.entry["name"]]["count"]
-
-        if updated_count <= 1:
+        if previous_count <= 1:
             log_message(interaction, f"⚠️ Cannot decrease `{self.entry['name']}` below `1` in `{self.guild_id}`")  
             await interaction.response.send_message("⚠️ Count cannot go below 1.", ephemeral=True)
             return
 
-        self.data[self.guild_id][self.entry["name"]]["count"] -= 1
-        save_json(self.guild_id, self.entry["name"], self.data[self.guild_id][self.entry["name"]])  
-
-        updated_count = self.data[self.guild_id][self.entry["name"]]["count"]
-
         embed = discord.Embed(
             title=f"Adjust Count for `{self.entry['name']}`",
             description=f"Current count: `{updated_count}`",
             color=discord.Color.red()
         )
 
-        new_view = AdjustButtonView(self.guild_id, {"name": self.entry["name"], "count": updated_count}, self.data)  
+        new_view = AdjustButtonView(self.guild_id, {"name": self.entry["name"], "count": updated_count})  
         await interaction.response.edit_message(embed=embed, view=new_view)
 
 class CountDropdown(discord.ui.Select):
-    def __init__(self, guild_id, names, data):
+    def __init__(self, guild_id, names):
         self.guild_id = str(guild_id)
-        self.data = data  # ✅ Use the passed data
 
-        reversed_names = names[::-1]
-        options = [discord.SelectOption(label=name["name"], value=name["name"]) for name in reversed_names]
+        options = [discord.SelectOption(label=name, value=name) for name in names]
 
         log_message("System", f"🔹 Initializing CountDropdown for `{guild_id}` with `{len(options)}` options.")  
         super().__init__(placeholder="Select a name to adjust count", min_values=1, max_values=1, options=options)
 
+    @tracked("component")
     async def callback(self, interaction):
         selected_name = self.values[0]
         log_message(interaction, f"✅ `{selected_name}` selected for adjustment in `{self.guild_id}`")  
 
-        entry = {"name": selected_name, "count": self.data[self.guild_id][selected_name]["count"]} if selected_name in self.data.get(self.guild_id, {}) else None
+        current = load_json().get(self.guild_id, {}).get(selected_name)
+        entry = {"name": selected_name, "count": current["count"]} if current else None
 
         if entry:
-            view = AdjustButtonView(self.guild_id, entry, self.data)  
+            view = AdjustButtonView(self.guild_id, entry)  
             embed = discord.Embed(title=f"Adjust Count for `{selected_name}`", description=f"Current count: `{entry['count']}`", color=discord.Color.green())
             await interaction.response.edit_message(embed=embed, view=view)
         else:
             await interaction.response.edit_message(embed=discord.Embed(title="⚠️ Name Not Found", description="Could not find selected name.", color=discord.Color.red()), view=None)
 
 @bot.tree.command(name="adjustcount", description="Manually adjust the count for a name")
-async def adjustcount(interaction: discord.Interaction):
+@app_commands.describe(name="Start typing to pick a name (leave empty for the menu)")
+@app_commands.autocomplete(name=bone_name_autocomplete)
+@tracked("command")
+async def adjustcount(interaction: discord.Interaction, name: str = None):
     log_message(interaction, "🔹 Command initiated: `adjustcount`")  
 
     if not interaction.guild:  
@@ -1397,10 +2405,21 @@ async def adjustcount(interaction: discord.Interaction):
         await interaction.response.send_message(f"⚠️ The list is empty for `{interaction.guild.name}`!", ephemeral=True)
         return
 
-    name_list = [{"name": key, "count": value["count"]} for key, value in data[guild_id].items()]  
-    view = AdjustCountView(guild_id, name_list[::-1], data)  
+    if name is not None:
+        if name not in data[guild_id]:
+            log_message(interaction, f"⚠️ `{name}` not found in `{guild_id}`")
+            await interaction.response.send_message(f"⚠️ `{name}` is not on the list.", ephemeral=True)
+            return
+
+        entry = {"name": name, "count": data[guild_id][name]["count"]}
+        embed = discord.Embed(title=f"Adjust Count for `{name}`", description=f"Current count: `{entry['count']}`", color=discord.Color.green())
+        await interaction.response.send_message(embed=embed, view=AdjustButtonView(guild_id, entry), ephemeral=True)
+        return
+
+    leaderboard = bones_store.leaderboard(guild_id)
+    view = AdjustCountView(guild_id, leaderboard)  
 
-    log_message(interaction, f"✅ Sending adjustment menu for `{guild_id}` with `{len(name_list)}` entries.")  
+    log_message(interaction, f"✅ Sending adjustment menu for `{guild_id}` with `{len(leaderboard)}` entries.")  
     await interaction.response.send_message("Select a name to adjust count:", view=view, ephemeral=True)
 
 
@@ -1447,11 +2466,12 @@ async def send_paginated_help(interaction, help_data):
     log_message(interaction, "✅ Help menu successfully sent via DM.")  
 
 @bot.tree.command(name="help", description="Displays available commands and sends a detailed help menu via DM")
+@tracked("command")
 async def help(interaction: discord.Interaction):
     log_message(interaction, "🔹 Command initiated: `help`")  
     await interaction.response.defer(ephemeral=True)  
 
-    help_data = load_help_data()
+    help_data = await run_io(load_help_data)
 
     if not help_data:
         log_message(interaction, "⚠️ ERROR: No help data available!")  
@@ -1466,4 +2486,5 @@ async def help(interaction: discord.Interaction):
         await interaction.followup.send("⚠️ I couldn't send you a DM. Sending help here instead:", ephemeral=True)
 
 
+mark_startup("commands + views")
 bot.run(TOKEN)
\ No newline at end of file
@@ -0,0 +1,358 @@
+import json, logging, os, sqlite3, sys
+from datetime import datetime
+
+logger = logging.getLogger()
+
+
+def log_message(message):
+    logger.info(f"[System] Storage {message}")
+
+
+# ✅ Apply one bones op to an in-memory `{guild: {name: {"count": n}}}` dict
+def apply_bone_op(data, op):
+    guild_id, name = op["guild"], op["name"]
+
+    if op["op"] == "remove":
+        if guild_id in data and name in data[guild_id]:
+            del data[guild_id][name]  # ✅ Remove specific name
+            log_message(f"✅ DELETED `{name}` from `{guild_id}`!")
+
+        if guild_id in data and not data[guild_id]:  # ✅ If last entry removed, delete guild
+            del data[guild_id]
+            log_message(f"🗑 Removed empty guild `{guild_id}`!")
+
+    else:  # ✅ add / incr / set all carry the resulting count
+        data.setdefault(guild_id, {})[name] = {"count": op["count"]}
+
+
+def atomic_write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)  # ✅ Readers see the old or the new file, never half of one
+
+
+# ✅ Original flat-file layout: bones.json (+ op log), user_timezones.json, voicesettings.json, temp_channels.json
+class JsonStorage:
+    name = "json"
+    snapshot_writes = True  # ✅ bones.json is only rewritten at compaction; ops in between are journal appends
+
+    def __init__(self, bones_path="bones.json", journal_path="bones.journal",
+                 timezones_path="user_timezones.json", voice_path="voicesettings.json",
+                 temp_channels_path="temp_channels.json"):
+        self.bones_path = bones_path
+        self.journal_path = journal_path
+        self.timezones_path = timezones_path
+        self.voice_path = voice_path
+        self.temp_channels_path = temp_channels_path
+        self.journal = None
+
+    def read_json(self, path, label):
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+
+                if not isinstance(data, dict):  # ✅ Ensure it's structured correctly
+                    log_message(f"⚠️ ERROR: Expected dictionary in `{label}`, got {type(data)}! Fixing...")
+                    return {}
+
+                log_message(f"✅ Loaded {label} successfully.")
+                return data
+
+        except FileNotFoundError as e:
+            log_message(f"⚠️ ERROR: Failed to load {label}! {e}")
+            return {}
+
+        except json.JSONDecodeError as e:
+            # ✅ Keep the damaged file around instead of overwriting it on the next save
+            corrupt_path = f"{path}.corrupt-{int(datetime.now().timestamp())}"
+            os.replace(path, corrupt_path)
+            log_message(f"⚠️ ERROR: {label} is corrupted ({e})! Moved it to `{corrupt_path}`.")
+            return {}
+
+    # ---- bones ----
+
+    def load_bones(self):
+        data = self.read_json(self.bones_path, "bones.json")
+        replayed = self.replay(data)  # ✅ Recover anything written after the last snapshot
+        self.journal = open(self.journal_path, "a", encoding="utf-8")
+        if replayed:
+            self.compact_bones(data)  # ✅ Start from a clean snapshot so a torn tail never gets appended to
+        return data
+
+    def replay(self, data):
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return 0
+
+        replayed = 0
+        for line in lines:
+            try:
+                op = json.loads(line)
+            except json.JSONDecodeError:
+                log_message(f"⚠️ Skipping torn journal entry: {line.strip()!r}")  # ✅ Partial write from a crash
+                continue
+
+            apply_bone_op(data, op)
+            replayed += 1
+
+        if replayed:
+            log_message(f"🔁 Replayed {replayed} journaled bone ops from `{self.journal_path}`.")
+        return replayed
+
+    def record_bone_op(self, op):
+        try:
+            self.journal.write(json.dumps(op) + "\n")  # ✅ O(1) append instead of rewriting bones.json
+            self.journal.flush()
+        except IOError as e:
+            log_message(f"⚠️ ERROR: Failed to append to `{self.journal_path}`! {e}")
+
+    def compact_bones(self, data):
+        try:
+            atomic_write_json(self.bones_path, data)
+            self.journal.truncate(0)  # ✅ Everything journaled so far is now in the snapshot
+        except (IOError, OSError) as e:
+            log_message(f"⚠️ ERROR: Failed to compact bones.json! {e}")
+            return False
+        return True
+
+    # ---- user timezones ----
+
+    def load_timezones(self):
+        return self.read_json(self.timezones_path, "user_timezones.json")
+
+    def save_timezone(self, user_id, timezone):
+        user_data = self.read_json(self.timezones_path, "user_timezones.json")
+        user_data[str(user_id)] = timezone
+        try:
+            atomic_write_json(self.timezones_path, user_data)
+        except (IOError, OSError) as e:
+            log_message(f"⚠️ ERROR: Failed to write to user_timezones.json! {e}")
+
+    # ---- voice settings ----
+
+    def load_voicesettings(self):
+        return self.read_json(self.voice_path, "voicesettings.json")
+
+    def save_voicesettings(self, guild_id, settings):
+        voicesettings = self.read_json(self.voice_path, "voicesettings.json")
+        if settings is None:
+            voicesettings.pop(str(guild_id), None)
+        else:
+            voicesettings[str(guild_id)] = settings  # ✅ Convert ID to string to avoid issues
+        try:
+            atomic_write_json(self.voice_path, voicesettings)
+        except (IOError, OSError) as e:
+            log_message(f"⚠️ ERROR: Failed to save voicesettings.json! {e}")
+
+    # ---- temp voice channels ----
+
+    def load_temp_channels(self):
+        if not os.path.exists(self.temp_channels_path):
+            return {}  # ✅ First run: nothing tracked yet
+        registry = self.read_json(self.temp_channels_path, "temp_channels.json")
+        return {int(channel_id): (entry["guild"], entry["category"], entry.get("spare", False)) for channel_id, entry in registry.items()}
+
+    def save_temp_channels(self, registry):
+        try:
+            atomic_write_json(self.temp_channels_path, {
+                str(channel_id): {"guild": guild_id, "category": category_id, "spare": spare}
+                for channel_id, (guild_id, category_id, spare) in registry.items()
+            })
+        except (IOError, OSError) as e:
+            log_message(f"⚠️ ERROR: Failed to save temp_channels.json! {e}")
+
+    def add_temp_channel(self, channel_id, guild_id, category_id, spare=False):
+        registry = self.load_temp_channels()
+        registry[channel_id] = (guild_id, category_id, spare)
+        self.save_temp_channels(registry)
+
+    def remove_temp_channels(self, channel_ids):
+        registry = self.load_temp_channels()
+        for channel_id in channel_ids:
+            registry.pop(channel_id, None)
+        self.save_temp_channels(registry)
+
+    def close(self):
+        if self.journal:
+            self.journal.close()
+
+
+# ✅ Single-file SQLite database (WAL mode) with one row per name / user / guild
+class SqliteStorage:
+    name = "sqlite"
+    snapshot_writes = False  # ✅ Every bone op is its own row write
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS bones (
+            guild_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (guild_id, name)
+        );
+        CREATE TABLE IF NOT EXISTS user_timezones (
+            user_id TEXT PRIMARY KEY,
+            timezone TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS voicesettings (
+            guild_id TEXT PRIMARY KEY,
+            lobby_channel_id INTEGER,
+            category_id INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS temp_channels (
+            channel_id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            category_id INTEGER NOT NULL,
+            spare INTEGER NOT NULL DEFAULT 0
+        );
+    """
+
+    def __init__(self, path="bbc_bot.db"):
+        self.path = path
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)  # ✅ Autocommit per statement
+        self.db.execute("PRAGMA journal_mode=WAL")  # ✅ Appends to the WAL instead of rewriting pages in place
+        self.db.execute("PRAGMA synchronous=NORMAL")  # ✅ Durable across process crashes, fsync only at checkpoints
+        self.db.executescript(self.SCHEMA)
+        if "spare" not in {column for _, column, *_ in self.db.execute("PRAGMA table_info(temp_channels)")}:
+            self.db.execute("ALTER TABLE temp_channels ADD COLUMN spare INTEGER NOT NULL DEFAULT 0")  # ✅ Databases created before the pool flag
+        log_message(f"✅ Opened SQLite database `{path}`.")
+
+    # ---- bones ----
+
+    def load_bones(self):
+        data = {}
+        for guild_id, name, count in self.db.execute("SELECT guild_id, name, count FROM bones"):
+            data.setdefault(guild_id, {})[name] = {"count": count}
+        log_message(f"✅ Loaded bones for {len(data)} guilds from SQLite.")
+        return data
+
+    def record_bone_op(self, op):
+        try:
+            if op["op"] == "remove":
+                self.db.execute("DELETE FROM bones WHERE guild_id = ? AND name = ?", (op["guild"], op["name"]))
+            else:
+                self.db.execute(
+                    "INSERT INTO bones (guild_id, name, count) VALUES (?, ?, ?) "
+                    "ON CONFLICT (guild_id, name) DO UPDATE SET count = excluded.count",
+                    (op["guild"], op["name"], op["count"])
+                )
+        except sqlite3.Error as e:
+            log_message(f"⚠️ ERROR: Failed to write bone op {op}! {e}")
+
+    def compact_bones(self, data):
+        try:
+            self.db.execute("PRAGMA wal_checkpoint(PASSIVE)")  # ✅ Rows are already durable; just keep the WAL short
+        except sqlite3.Error as e:
+            log_message(f"⚠️ ERROR: WAL checkpoint failed! {e}")
+            return False
+        return True
+
+    # ---- user timezones ----
+
+    def load_timezones(self):
+        return {user_id: timezone for user_id, timezone in self.db.execute("SELECT user_id, timezone FROM user_timezones")}
+
+    def save_timezone(self, user_id, timezone):
+        try:
+            self.db.execute(
+                "INSERT INTO user_timezones (user_id, timezone) VALUES (?, ?) "
+                "ON CONFLICT (user_id) DO UPDATE SET timezone = excluded.timezone",
+                (str(user_id), timezone)
+            )
+        except sqlite3.Error as e:
+            log_message(f"⚠️ ERROR: Failed to save timezone for `{user_id}`! {e}")
+
+    # ---- voice settings ----
+
+    def load_voicesettings(self):
+        voicesettings = {}
+        for guild_id, lobby_id, category_id in self.db.execute("SELECT guild_id, lobby_channel_id, category_id FROM voicesettings"):
+            settings = {}
+            if category_id is not None:
+                settings["CATEGORY_ID"] = category_id
+            if lobby_id is not None:
+                settings["LOBBY_CHANNEL_ID"] = lobby_id
+            voicesettings[guild_id] = settings
+        return voicesettings
+
+    def save_voicesettings(self, guild_id, settings):
+        try:
+            if settings is None:
+                self.db.execute("DELETE FROM voicesettings WHERE guild_id = ?", (str(guild_id),))
+            else:
+                self.db.execute(
+                    "INSERT INTO voicesettings (guild_id, lobby_channel_id, category_id) VALUES (?, ?, ?) "
+                    "ON CONFLICT (guild_id) DO UPDATE SET lobby_channel_id = excluded.lobby_channel_id, category_id = excluded.category_id",
+                    (str(guild_id), settings.get("LOBBY_CHANNEL_ID"), settings.get("CATEGORY_ID"))
+                )
+        except sqlite3.Error as e:
+            log_message(f"⚠️ ERROR: Failed to save voicesettings for `{guild_id}`! {e}")
+
+    # ---- temp voice channels ----
+
+    def load_temp_channels(self):
+        return {channel_id: (guild_id, category_id, bool(spare))
+                for channel_id, guild_id, category_id, spare in self.db.execute("SELECT channel_id, guild_id, category_id, spare FROM temp_channels")}
+
+    def add_temp_channel(self, channel_id, guild_id, category_id, spare=False):
+        try:
+            self.db.execute(
+                "INSERT OR REPLACE INTO temp_channels (channel_id, guild_id, category_id, spare) VALUES (?, ?, ?, ?)",
+                (channel_id, guild_id, category_id, int(spare))
+            )
+        except sqlite3.Error as e:
+            log_message(f"⚠️ ERROR: Failed to record temp channel `{channel_id}`! {e}")
+
+    def remove_temp_channels(self, channel_ids):
+        try:
+            self.db.executemany("DELETE FROM temp_channels WHERE channel_id = ?", [(channel_id,) for channel_id in channel_ids])
+        except sqlite3.Error as e:
+            log_message(f"⚠️ ERROR: Failed to remove temp channels {list(channel_ids)}! {e}")
+
+    def close(self):
+        self.db.close()
+
+
+# ✅ One-shot copy of the JSON files into SQLite (safe to re-run; rows are upserted)
+def migrate_json_to_sqlite(source, target):
+    bones = source.load_bones()
+    timezones = source.load_timezones()
+    voicesettings = source.load_voicesettings()
+    temp_channels = source.load_temp_channels()
+
+    target.db.execute("BEGIN")
+    try:
+        for guild_id, names in bones.items():
+            for name, entry in names.items():
+                target.record_bone_op({"op": "set", "guild": guild_id, "name": name, "count": entry.get("count", 0)})
+        for user_id, timezone in timezones.items():
+            target.save_timezone(user_id, timezone)
+        for guild_id, settings in voicesettings.items():
+            target.save_voicesettings(guild_id, settings)
+        for channel_id, (guild_id, category_id, spare) in temp_channels.items():
+            target.add_temp_channel(channel_id, guild_id, category_id, spare)
+        target.db.execute("COMMIT")
+    except Exception:
+        target.db.execute("ROLLBACK")
+        raise
+
+    bone_rows = sum(len(names) for names in bones.values())
+    log_message(f"✅ Migrated {bone_rows} bones, {len(timezones)} timezones and {len(voicesettings)} voice settings to `{target.path}`.")
+    return bone_rows, len(timezones), len(voicesettings)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "migrate":
+        print("Usage: python storage.py migrate [sqlite_path]")
+        sys.exit(1)
+
+    logging.basicConfig(format="[%(asctime)s] %(message)s", level=logging.INFO, datefmt="%Y-%m-%d %H:%M:%S")
+    source = JsonStorage()
+    target = SqliteStorage(sys.argv[2] if len(sys.argv) > 2 else "bbc_bot.db")
+    migrate_json_to_sqlite(source, target)
+    source.close()
+    target.close()
@@ -0,0 +1,63 @@
+import asyncio, functools, os, random, sys, tempfile, time
+from concurrent.futures import ThreadPoolExecutor
+
+from bones import BonesStore, update_bone
+from storage import JsonStorage
+
+io_executor = ThreadPoolExecutor(max_workers=1)  # ✅ One worker, like the bot's, so journal appends keep their order
+
+
+async def run_io(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(io_executor, functools.partial(func, *args))
+
+
+# ✅ Gives the loop away between `update_bone`'s read and its write, the way a slow handler would;
+# without the guild lock, increments that land in that gap are lost
+class YieldingBonesStore(BonesStore):
+    async def save(self, guild_id, key, value):
+        await asyncio.sleep(0)
+        await super().save(guild_id, key, value)
+
+
+# ✅ `python stress_bones.py [increments] [guilds]`: concurrent `update_bone` calls against a throwaway JSON store
+async def stress_bones(increments=5000, guild_count=3, names_per_guild=4):
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = [os.path.join(workdir, name) for name in ("bones.json", "bones.journal", "tz.json", "voice.json", "temp.json")]
+        storage = JsonStorage(*paths)
+        store = YieldingBonesStore(storage, run_io)
+
+        targets = [(f"guild{g}", f"Name{n}") for g in range(guild_count) for n in range(names_per_guild)]
+        picks = [random.choice(targets) for _ in range(increments)]
+        expected = {target: picks.count(target) for target in targets}
+
+        async def increment(guild_id, name):
+            await asyncio.sleep(random.random() / 100)  # ✅ Spread arrivals so calls interleave
+            await update_bone(store, guild_id, name, lambda count: (count or 0) + 1)
+
+        async def compact_repeatedly():
+            for _ in range(5):
+                await asyncio.sleep(0.002)
+                await store.compact()  # ✅ Snapshots racing the increments must not drop journaled ops
+
+        started = time.perf_counter()
+        await asyncio.gather(compact_repeatedly(), *(increment(guild_id, name) for guild_id, name in picks))
+        elapsed = time.perf_counter() - started
+
+        actual = {(guild_id, name): store.data.get(guild_id, {}).get(name, {}).get("count", 0) for guild_id, name in targets}
+        lost = sum(expected.values()) - sum(actual.values())
+        totals_match = all(
+            store.leaderboard(guild_id).total == sum(entry["count"] for entry in store.data[guild_id].values())
+            for guild_id in {guild_id for guild_id, _ in targets}
+        )
+
+        storage.close()
+        replayed = JsonStorage(*paths).load_bones()  # ✅ What a restart would see: snapshot + journal
+        replay_matches = replayed == store.data
+
+    print(f"{increments} increments over {len(targets)} names in {elapsed:.2f}s: "
+          f"lost {lost}, leaderboard totals {'ok' if totals_match else 'WRONG'}, journal replay {'ok' if replay_matches else 'WRONG'}")
+    return 0 if actual == expected and totals_match and replay_matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(stress_bones(*map(int, sys.argv[1:3]))))
@@ -0,0 +1,52 @@
+import glob, gzip, json, math, sys
+from collections import defaultdict
+
+
+# ✅ Nearest-rank percentile over an already sorted list
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def read_events(paths):
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # ✅ Torn last line while the bot is still writing
+
+
+def summarize(events):
+    durations = defaultdict(list)
+    errors = defaultdict(int)
+    for event in events:
+        key = (event.get("type", "?"), event.get("name", "?"))
+        durations[key].append(event.get("duration_ms", 0.0))
+        if event.get("outcome", "ok") != "ok":
+            errors[key] += 1
+
+    rows = []
+    for key, values in durations.items():
+        values.sort()
+        rows.append((key[0], key[1], len(values), errors[key],
+                     percentile(values, 50), percentile(values, 90), percentile(values, 99), values[-1]))
+    return sorted(rows, key=lambda row: (row[0], -row[6]))
+
+
+if __name__ == "__main__":
+    # ✅ Default: the live file plus its rotated archives
+    paths = sys.argv[1:] or sorted(glob.glob("events.jsonl.*.gz"), reverse=True) + ["events.jsonl"]
+    rows = summarize(read_events(path for path in paths if glob.glob(path)))
+
+    if not rows:
+        print("No events found.")
+        sys.exit(0)
+
+    print(f"{'type':<10} {'name':<36} {'count':>7} {'errors':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for kind, name, count, error_count, p50, p90, p99, worst in rows:
+        print(f"{kind:<10} {name:<36} {count:>7} {error_count:>6} {p50:>9.1f} {p90:>9.1f} {p99:>9.1f} {worst:>9.1f}")